@@ -0,0 +1,252 @@
+"""
+Benchmark Suite - Remote Work Tracker
+======================================
+Times the ETL and export code paths on synthetic Remotive data and compares
+the results against a stored baseline.
+
+Benchmarked operations:
+    transform_data, DBConnector.insert_jobs, DBConnector.fetch_all_jobs and
+    every DataExporter export method. transform_data and the export methods
+    are called through `__wrapped__`, without their @timed instrumentation
+    wrapper, so the timings measure the code itself.
+
+Usage:
+    # Run at 10k rows and compare against benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --scale 10k
+
+    # Record the current timings as the new baseline for this scale
+    python benchmarks/run_benchmarks.py --scale 100k --update-baseline
+
+The script exits with status 1 when any benchmark is slower than the
+baseline by more than --threshold, or when --threshold is given and there is
+no baseline for the scale. benchmarks/baseline.json holds a 10k baseline.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+SRC_DIR = BENCHMARK_DIR.parent / "src"
+for module_dir in ("db", "etl", "utils", "scraper"):
+    sys.path.insert(0, str(SRC_DIR / module_dir))
+sys.path.insert(0, str(BENCHMARK_DIR))
+
+from synthetic_data import RemotiveDataGenerator, parse_scale
+from db_connector import DBConnector
+from etl_script import transform_data
+from export_data import DataExporter
+
+DEFAULT_BASELINE = BENCHMARK_DIR / "baseline.json"
+DEFAULT_RESULTS_DIR = BENCHMARK_DIR / "results"
+
+# Slowdowns smaller than this are treated as timer noise, whatever the percentage
+MIN_REGRESSION_SECONDS = 0.01
+
+DEFAULT_THRESHOLD = 0.2
+
+
+def time_call(func, repeat, setup=None):
+    """
+    Times a callable and returns the best of `repeat` runs in seconds.
+
+    Args:
+        func: Callable to time. Receives the value returned by `setup`.
+        repeat: Number of timed runs.
+        setup: Optional untimed callable run before each timed run.
+    """
+    timings = []
+    for _ in range(repeat):
+        arg = setup() if setup else None
+        gc.collect()
+        start = time.perf_counter()
+        func(arg)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run_benchmarks(rows, repeat=3, seed=42):
+    """
+    Runs every benchmark on `rows` synthetic records.
+
+    Args:
+        rows: Number of synthetic records.
+        repeat: Number of timed runs per benchmark (best is kept).
+        seed: Random seed for the data generator.
+
+    Returns:
+        Dict mapping benchmark name to its best time in seconds.
+    """
+    print(f"Generating {rows} synthetic records...")
+    raw_df = RemotiveDataGenerator(seed=seed).generate_dataframe(rows)
+    transformed_df = transform_data(raw_df)
+
+    categories = transformed_df["category"].value_counts()
+    category = categories.index[0]
+    dates = transformed_df["publication_date"].sort_values()
+    start_date = dates.iloc[len(dates) // 4][:10]
+    end_date = dates.iloc[3 * len(dates) // 4][:10]
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+
+        # Unwrapped, so the @timed instrumentation isn't part of the timings
+        transform = transform_data.__wrapped__
+        results["transform_data"] = time_call(lambda _: transform(raw_df), repeat)
+
+        def fresh_db():
+            db_path = tmp / f"insert_{time.perf_counter_ns()}.db"
+            db = DBConnector(str(db_path))
+            db.connect()
+            db.create_table()
+            return db
+
+        def insert(db):
+            db.insert_jobs(transformed_df)
+            db.disconnect()
+
+        results["insert_jobs"] = time_call(insert, repeat, setup=fresh_db)
+
+        db_path = tmp / "benchmark.db"
+        db = DBConnector(str(db_path))
+        db.connect()
+        db.create_table()
+        db.insert_jobs(transformed_df)
+        db.refresh_metadata()
+        results["fetch_all_jobs"] = time_call(lambda _: db.fetch_all_jobs(), repeat)
+        db.disconnect()
+
+        exporter = DataExporter(db_name=str(db_path), output_dir=str(tmp / "exports"))
+
+        def unwrapped(method_name):
+            """Returns an export method of `exporter` without its @timed wrapper."""
+            return getattr(DataExporter, method_name).__wrapped__.__get__(exporter)
+
+        export_calls = {
+            "export_all_jobs": lambda _: unwrapped("export_all_jobs")("all.csv"),
+            "export_by_category": lambda _: unwrapped("export_by_category")(category, "category.csv"),
+            "export_by_date_range": lambda _: unwrapped("export_by_date_range")(start_date, end_date, "range.csv"),
+            "export_summary_statistics": lambda _: unwrapped("export_summary_statistics")("summary.csv"),
+            "export_for_powerbi": lambda _: unwrapped("export_for_powerbi")("powerbi.csv"),
+        }
+        for name, call in export_calls.items():
+            results[name] = time_call(call, repeat)
+        # Sharded exports refuse a non-empty directory, so each run gets its own
+        results["export_sharded"] = time_call(
+            lambda dirname: unwrapped("export_sharded")(dirname=dirname), repeat,
+            setup=lambda: f"sharded_{time.perf_counter_ns()}",
+        )
+
+    return results
+
+
+def compare_to_baseline(results, baseline, threshold):
+    """
+    Compares benchmark results with baseline timings.
+
+    Args:
+        results: Dict of benchmark name to seconds.
+        baseline: Dict of benchmark name to baseline seconds.
+        threshold: Allowed slowdown as a fraction (0.2 = 20% slower).
+
+    Returns:
+        List of (name, baseline_seconds, seconds, change) tuples for regressions.
+    """
+    regressions = []
+    for name, seconds in results.items():
+        base = baseline.get(name)
+        if not base:
+            print(f"  {name:<28} {seconds:>9.4f}s  (no baseline)")
+            continue
+        change = (seconds - base) / base
+        regressed = change > threshold and seconds - base > MIN_REGRESSION_SECONDS
+        status = "REGRESSION" if regressed else "ok"
+        print(f"  {name:<28} {seconds:>9.4f}s  baseline {base:>9.4f}s  {change:+7.1%}  {status}")
+        if regressed:
+            regressions.append((name, base, seconds, change))
+    return regressions
+
+
+def main():
+    """
+    Main function to run the benchmark suite from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the ETL and export code paths")
+    parser.add_argument("--scale", default="10k",
+                        help="Number of records: 10k, 100k, 1m or an integer (default: 10k)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Timed runs per benchmark, best is kept (default: 3)")
+    parser.add_argument("--seed", type=int, default=42,
+                        help="Random seed for the data generator (default: 42)")
+    parser.add_argument("--baseline", type=str, default=str(DEFAULT_BASELINE),
+                        help="Baseline JSON file (default: benchmarks/baseline.json)")
+    parser.add_argument("--threshold", type=float, default=None,
+                        help="Allowed slowdown before failing, as a fraction (default: 0.2). "
+                             "When given, a missing baseline is also a failure")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Store this run's timings as the baseline for the scale")
+    parser.add_argument("--output-dir", type=str, default=str(DEFAULT_RESULTS_DIR),
+                        help="Directory for result JSON files (default: benchmarks/results)")
+    args = parser.parse_args()
+
+    scale = str(args.scale).lower()
+    rows = parse_scale(scale)
+    results = run_benchmarks(rows, repeat=args.repeat, seed=args.seed)
+
+    report = {
+        "scale": scale,
+        "rows": rows,
+        "repeat": args.repeat,
+        "seed": args.seed,
+        "timestamp": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "instrumentation": "excluded",
+        "results": {name: round(seconds, 6) for name, seconds in results.items()},
+    }
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = output_dir / f"benchmark_{scale}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\n✅ Benchmark results saved to: {output_path}")
+
+    baseline_path = Path(args.baseline)
+    baselines = {}
+    if baseline_path.exists():
+        with open(baseline_path, encoding="utf-8") as f:
+            baselines = json.load(f)
+
+    if args.update_baseline:
+        baselines[scale] = report["results"]
+        with open(baseline_path, "w", encoding="utf-8") as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+        print(f"✅ Baseline for scale '{scale}' updated in: {baseline_path}")
+        return 0
+
+    if scale not in baselines:
+        print(f"⚠️ No baseline for scale '{scale}'. Run with --update-baseline to record one.")
+        # An explicit threshold means the caller is gating on the comparison
+        return 1 if args.threshold is not None else 0
+
+    threshold = DEFAULT_THRESHOLD if args.threshold is None else args.threshold
+    print(f"\nComparison against baseline (threshold {threshold:.0%}):")
+    regressions = compare_to_baseline(report["results"], baselines[scale], threshold)
+    if regressions:
+        print(f"\n❌ {len(regressions)} benchmark(s) regressed beyond {threshold:.0%}.")
+        return 1
+
+    print("\n✅ No regressions detected.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,230 @@
+"""
+Synthetic Remotive Data Generator - Remote Work Tracker
+========================================================
+Generates realistic Remotive-shaped job records for benchmarking.
+
+Distributions (job titles, companies, job types, locations, salary strings,
+salary coverage, HTML description structure and publication dates) are
+seeded from the scraped sample in data/raw/remotive_jobs.csv. The output has
+the same columns as the scraper CSV, so it can be fed straight into
+`transform_data`.
+
+Usage:
+    python benchmarks/synthetic_data.py --scale 100k --output synthetic_jobs.csv
+"""
+
+import argparse
+import csv
+import random
+import re
+import sys
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+
+SEED_CSV = Path(__file__).resolve().parent.parent / "data" / "raw" / "remotive_jobs.csv"
+
+SCALES = {
+    "10k": 10_000,
+    "100k": 100_000,
+    "1m": 1_000_000,
+}
+
+COLUMNS = [
+    "Job ID", "Job Title", "Company Name", "Publication Date", "Job Type",
+    "Category", "Candidate Required Location", "Salary Range", "Job Description",
+    "Source URL", "Company Logo", "Job Board",
+]
+
+# Remotive's public categories. The seed sample may only cover a few of them,
+# so the rest are mixed in to give category-level exports a realistic spread.
+REMOTIVE_CATEGORIES = [
+    "Software Development", "Customer Service", "Design", "Marketing",
+    "Sales / Business", "Product", "Project Management", "Data Analysis",
+    "DevOps / Sysadmin", "Finance / Legal", "Human Resources", "QA",
+    "Writing", "All others",
+]
+
+# Number of distinct descriptions built per run. Records share these strings
+# by reference, which keeps memory bounded at the 1M scale.
+DESCRIPTION_POOL_SIZE = 5000
+
+HTML_BLOCK_RE = re.compile(r"<(p|ul|ol|h\d)\b[^>]*>.*?</\1>", re.S)
+
+
+def parse_scale(scale):
+    """Converts a scale name (10k/100k/1m) or an integer string to a row count."""
+    scale = str(scale).lower()
+    if scale in SCALES:
+        return SCALES[scale]
+    return int(scale)
+
+
+class RemotiveDataGenerator:
+    """
+    Generates synthetic Remotive job records from seeded distributions.
+
+    Attributes:
+        rng (random.Random): Seeded random generator, for reproducible output.
+    """
+
+    def __init__(self, seed_csv=SEED_CSV, seed=42):
+        """
+        Initialize the generator.
+
+        Args:
+            seed_csv: Scraped Remotive CSV to derive distributions from.
+            seed: Random seed. The same seed always yields the same records.
+        """
+        self.rng = random.Random(seed)
+        self._load_distributions(seed_csv)
+        self._descriptions = [self._build_description() for _ in range(DESCRIPTION_POOL_SIZE)]
+
+    def _load_distributions(self, seed_csv):
+        """Reads the seed CSV and collects value frequencies for each field."""
+        csv.field_size_limit(sys.maxsize)
+        with open(seed_csv, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+
+        if not rows:
+            raise ValueError(f"Seed file {seed_csv} has no records.")
+
+        self.job_titles = [r["Job Title"] for r in rows]
+        self.company_names = sorted({r["Company Name"] for r in rows})
+        self.job_types = Counter(r["Job Type"] for r in rows)
+        self.locations = Counter(r["Candidate Required Location"] for r in rows)
+        self.salaries = [r["Salary Range"] for r in rows if r["Salary Range"]]
+        self.salary_ratio = len(self.salaries) / len(rows)
+
+        categories = Counter(r["Category"] for r in rows)
+        min_weight = min(categories.values())
+        for category in REMOTIVE_CATEGORIES:
+            categories[category] = max(categories[category], min_weight)
+        self.categories = categories
+
+        self.html_blocks = []
+        self.block_counts = []
+        for r in rows:
+            blocks = [m.group(0) for m in HTML_BLOCK_RE.finditer(r["Job Description"])]
+            if blocks:
+                self.html_blocks.extend(blocks)
+                self.block_counts.append(len(blocks))
+
+        dates = sorted(datetime.fromisoformat(r["Publication Date"]) for r in rows)
+        self.date_start = dates[0]
+        self.date_span = max((dates[-1] - dates[0]).total_seconds(), 1)
+
+    def _weighted(self, counter):
+        """Draws one value from a Counter using its counts as weights."""
+        return self.rng.choices(list(counter.keys()), weights=list(counter.values()))[0]
+
+    def _build_description(self):
+        """Builds an HTML description from sampled blocks of real descriptions."""
+        if not self.html_blocks:
+            return "<p>Synthetic job description.</p>"
+        block_count = self.rng.choice(self.block_counts)
+        return "".join(self.rng.choices(self.html_blocks, k=block_count))
+
+    def generate_record(self, job_id):
+        """
+        Generates a single job record.
+
+        Args:
+            job_id: Unique job ID for the record.
+
+        Returns:
+            Dict with the scraper CSV columns.
+        """
+        rng = self.rng
+        title = rng.choice(self.job_titles)
+        # Company suffixes grow the number of distinct companies with the scale
+        company = f"{rng.choice(self.company_names)} {rng.randrange(1000)}"
+        published = self.date_start + timedelta(seconds=rng.uniform(0, self.date_span))
+        slug = re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-")
+
+        return {
+            "Job ID": job_id,
+            "Job Title": title,
+            "Company Name": company,
+            "Publication Date": published.replace(microsecond=0).isoformat(),
+            "Job Type": self._weighted(self.job_types),
+            "Category": self._weighted(self.categories),
+            "Candidate Required Location": self._weighted(self.locations),
+            "Salary Range": rng.choice(self.salaries) if rng.random() < self.salary_ratio else "",
+            "Job Description": rng.choice(self._descriptions),
+            "Source URL": f"https://remotive.com/remote-jobs/synthetic/{slug}-{job_id}",
+            "Company Logo": f"https://remotive.com/job/{job_id}/logo",
+            "Job Board": "Remotive.com",
+        }
+
+    def generate_records(self, count, start_id=3_000_000):
+        """
+        Yields `count` job records with consecutive IDs.
+
+        Args:
+            count: Number of records to generate.
+            start_id: ID of the first record.
+        """
+        for job_id in range(start_id, start_id + count):
+            yield self.generate_record(job_id)
+
+    def generate_dataframe(self, count, start_id=3_000_000):
+        """
+        Generates `count` records as a Pandas DataFrame shaped like the scraper output.
+
+        Args:
+            count: Number of records to generate.
+            start_id: ID of the first record.
+        """
+        import pandas as pd
+
+        # Fill one list per column so only one record dict is alive at a time,
+        # instead of holding `count` dicts until the DataFrame is built
+        columns = {column: [] for column in COLUMNS}
+        appends = [(column, columns[column].append) for column in COLUMNS]
+        for record in self.generate_records(count, start_id):
+            for column, append in appends:
+                append(record[column])
+        return pd.DataFrame(columns, columns=COLUMNS)
+
+    def write_csv(self, path, count, start_id=3_000_000):
+        """
+        Streams `count` records to a CSV file without holding them in memory.
+
+        Args:
+            path: Output CSV path.
+            count: Number of records to generate.
+            start_id: ID of the first record.
+
+        Returns:
+            Path to the written CSV file.
+        """
+        path = Path(path)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=COLUMNS)
+            writer.writeheader()
+            writer.writerows(self.generate_records(count, start_id))
+        return path
+
+
+def main():
+    """
+    Main function to generate a synthetic dataset from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Generate synthetic Remotive job records")
+    parser.add_argument("--scale", default="10k",
+                        help="Number of records: 10k, 100k, 1m or an integer (default: 10k)")
+    parser.add_argument("--seed", type=int, default=42,
+                        help="Random seed (default: 42)")
+    parser.add_argument("--output", "-o", default="synthetic_remotive_jobs.csv",
+                        help="Output CSV file (default: synthetic_remotive_jobs.csv)")
+    args = parser.parse_args()
+
+    count = parse_scale(args.scale)
+    generator = RemotiveDataGenerator(seed=args.seed)
+    output_path = generator.write_csv(args.output, count)
+    print(f"✅ Generated {count} synthetic jobs to: {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,10 @@
 import sqlite3
-import pandas as pd
 from datetime import datetime
+from pathlib import Path
+from metadata_cache import refresh_metadata
+
+# pandas is imported inside the methods that need it, so that commands
+# answering from the metadata cache start quickly
 
 class DBConnector:
     def __init__(self, db_name="remote_jobs.db"):
@@ -8,10 +12,16 @@ class DBConnector:
         self.conn = None
         self.cursor = None
 
-    def connect(self):
-        """Establishes a connection to the SQLite database."""
+    def connect(self, read_only=False):
+        """Establishes a connection to the SQLite database.
+           With read_only=True the database is opened in SQLite's read-only mode,
+           which lets many processes query it safely at the same time.
+        """
         try:
-            self.conn = sqlite3.connect(self.db_name)
+            if read_only:
+                self.conn = sqlite3.connect(f"{Path(self.db_name).resolve().as_uri()}?mode=ro", uri=True)
+            else:
+                self.conn = sqlite3.connect(self.db_name)
             self.cursor = self.conn.cursor()
             print(f"Connected to database: {self.db_name}")
         except sqlite3.Error as e:
@@ -45,20 +55,36 @@ class DBConnector:
             ingestion_timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         );
         """
+        # Serve sharded exports, which query one shard at a time: the first index
+        # covers category and category/month shards, the second month-only shards.
+        # The month expression must match export_data.SHARD_KEYS exactly.
+        create_shard_indexes_sql = [
+            """
+            CREATE INDEX IF NOT EXISTS idx_remote_jobs_category_month
+            ON remote_jobs (category, substr(publication_date, 1, 7));
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS idx_remote_jobs_month
+            ON remote_jobs (substr(publication_date, 1, 7));
+            """,
+        ]
         try:
             self.cursor.execute(create_table_sql)
+            for create_index_sql in create_shard_indexes_sql:
+                self.cursor.execute(create_index_sql)
             self.conn.commit()
             print("Table 'remote_jobs' ensured to exist.")
         except sqlite3.Error as e:
             print(f"Error creating table: {e}")
 
-    def insert_jobs(self, df: pd.DataFrame):
+    def insert_jobs(self, df):
         """Inserts job data from a Pandas DataFrame into the remote_jobs table.
            Handles duplicates by ignoring entries with existing source_url.
+           Returns the number of records written or ignored, or None on error.
         """
         if df.empty:
             print("No data to insert.")
-            return
+            return 0
 
         if not self.conn:
             self.connect()
@@ -96,16 +122,87 @@ class DBConnector:
             self.cursor.executemany(insert_sql, data_to_insert)
             self.conn.commit()
             print(f"Successfully inserted/ignored {len(data_to_insert)} records into 'remote_jobs'.")
+            return len(data_to_insert)
+        except sqlite3.Error as e:
+            print(f"Error inserting data: {e}")
+            return None
+
+    def insert_records(self, records, batch_size=1000):
+        """Inserts job records straight into the remote_jobs table, without a DataFrame.
+           Records are JobRecords, or tuples in remote_jobs column order that may
+           leave out the trailing optional fields (e.g. ingestion_timestamp).
+           They are consumed in batches, so a streaming source is never fully
+           held in memory. Duplicates (existing source_url) and rows missing a
+           required field are ignored.
+           Returns the number of rows actually inserted.
+        """
+        from job_record import JobRecord
+
+        if not self.conn:
+            self.connect()
+            self.create_table() # Ensure table exists before inserting
+
+        insert_sql = """
+        INSERT OR IGNORE INTO remote_jobs (
+            id, job_title, company_name, publication_date, job_type, category,
+            candidate_required_location, salary_range, job_description, source_url,
+            company_logo, job_board, ingestion_timestamp
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
+        """
+        ingestion_timestamp = datetime.now().isoformat() # Default if not set by the source
+        received = 0
+        changes_before = self.conn.total_changes
+        batch = []
+        try:
+            for record in records:
+                record = JobRecord(*record)
+                if record.ingestion_timestamp is None:
+                    record = record._replace(ingestion_timestamp=ingestion_timestamp)
+                batch.append(record)
+                if len(batch) >= batch_size:
+                    self.cursor.executemany(insert_sql, batch)
+                    received += len(batch)
+                    batch = []
+            if batch:
+                self.cursor.executemany(insert_sql, batch)
+                received += len(batch)
+            self.conn.commit()
         except sqlite3.Error as e:
             print(f"Error inserting data: {e}")
+            self.conn.rollback()
+            return 0
+        inserted = self.conn.total_changes - changes_before
+        print(f"Successfully inserted {inserted} of {received} records into 'remote_jobs' "
+              f"({received - inserted} duplicates or invalid records ignored).")
+        return inserted
+
+    def refresh_metadata(self):
+        """Rebuilds the metadata cache (row count, categories, date bounds, last load).
+           Call it once after a load has finished, not after every insert.
+        """
+        if self.db_name == ":memory:":
+            return None
+        if not self.conn:
+            self.connect()
+        return refresh_metadata(self.conn, self.db_name)
 
     def fetch_all_jobs(self):
         """Fetches all job records from the database."""
+        return self._fetch_jobs("SELECT * FROM remote_jobs;")
+
+    def fetch_jobs_by_category(self, category):
+        """Fetches the job records of a single category from the database."""
+        return self._fetch_jobs("SELECT * FROM remote_jobs WHERE category = ?;", (category,))
+
+    def _fetch_jobs(self, query, params=()):
+        """Runs a SELECT on remote_jobs and returns the rows as a DataFrame."""
+        import pandas as pd
+
         if not self.conn:
             self.connect()
 
         try:
-            self.cursor.execute("SELECT * FROM remote_jobs;")
+            self.cursor.execute(query, params)
             columns = [description[0] for description in self.cursor.description]
             rows = self.cursor.fetchall()
             df = pd.DataFrame(rows, columns=columns)
@@ -115,6 +212,8 @@ class DBConnector:
             return pd.DataFrame()
 
 if __name__ == "__main__":
+    import pandas as pd
+
     db = DBConnector()
     db.connect()
     db.create_table()
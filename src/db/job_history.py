@@ -0,0 +1,313 @@
+"""
+Job History - Remote Work Tracker
+==================================
+Tracks the lifecycle of job postings across scrapes.
+
+Each scrape's set of job IDs is appended to a date-partitioned snapshot log
+on disk, and the compact `job_lifecycle` table (first_seen, last_seen,
+closed_at) is updated incrementally by diffing the new snapshot against the
+set of jobs that were still open after the previous one. Trend queries such
+as "jobs open on day X" or "time to fill" are answered from `job_lifecycle`
+alone, without rescanning the snapshot log.
+"""
+
+import sqlite3
+from datetime import date, datetime
+from pathlib import Path
+from db_connector import DBConnector
+
+
+class JobHistory:
+    """
+    Maintains the snapshot log and the `job_lifecycle` table.
+
+    Attributes:
+        db (DBConnector): Database connector instance.
+        snapshot_dir (Path): Root directory of the snapshot log.
+    """
+
+    def __init__(self, db_connector=None, snapshot_dir="data/snapshots"):
+        """
+        Initialize the JobHistory tracker.
+
+        Args:
+            db_connector: Connected DBConnector. A new one is created if None.
+            snapshot_dir: Root directory for the date-partitioned snapshot log.
+        """
+        self.db = db_connector or DBConnector()
+        self.snapshot_dir = Path(snapshot_dir)
+
+    def create_table(self):
+        """Creates the job_lifecycle table and its indexes if they don't exist."""
+        if not self.db.conn:
+            self.db.connect()
+
+        create_table_sql = """
+        CREATE TABLE IF NOT EXISTS job_lifecycle (
+            job_id INTEGER NOT NULL,
+            first_seen TEXT NOT NULL,
+            last_seen TEXT NOT NULL,
+            closed_at TEXT,
+            PRIMARY KEY (job_id, first_seen)
+        );
+        CREATE INDEX IF NOT EXISTS idx_job_lifecycle_open
+            ON job_lifecycle (closed_at);
+        CREATE INDEX IF NOT EXISTS idx_job_lifecycle_first_seen
+            ON job_lifecycle (first_seen);
+        """
+        try:
+            self.db.cursor.executescript(create_table_sql)
+            self.db.conn.commit()
+            print("Table 'job_lifecycle' ensured to exist.")
+        except sqlite3.Error as e:
+            print(f"Error creating job_lifecycle table: {e}")
+
+    def write_snapshot(self, job_ids, snapshot_date=None):
+        """
+        Appends a snapshot of job IDs to the date-partitioned log.
+
+        Snapshots are never overwritten; each scrape gets its own file under
+        `snapshot_date=YYYY-MM-DD/`.
+
+        Args:
+            job_ids: Iterable of job IDs seen in the scrape.
+            snapshot_date: Date of the scrape (date or YYYY-MM-DD). Defaults to today.
+
+        Returns:
+            Path to the written snapshot file.
+        """
+        snapshot_date = _as_date(snapshot_date)
+        partition = self.snapshot_dir / f"snapshot_date={snapshot_date.isoformat()}"
+        partition.mkdir(parents=True, exist_ok=True)
+
+        timestamp = datetime.now().strftime("%H%M%S_%f")
+        snapshot_path = partition / f"job_ids_{timestamp}.txt"
+        # Exclusive mode keeps the log append-only
+        with open(snapshot_path, "x", encoding="utf-8") as f:
+            f.writelines(f"{job_id}\n" for job_id in sorted(job_ids))
+
+        return snapshot_path
+
+    def record_snapshot(self, job_ids, snapshot_date=None):
+        """
+        Records a scrape: updates job_lifecycle and appends it to the snapshot log.
+
+        Each row of job_lifecycle is one open interval of a job, and the set
+        of currently open rows is the previous snapshot, so only the set
+        differences are written:
+            * new IDs get a row with first_seen = last_seen = snapshot date
+            * IDs still present get last_seen bumped
+            * open IDs that disappeared get closed_at = snapshot date
+            * closed IDs that reappeared get a new interval row, so the
+              earlier closure and the gap are kept. If they were closed
+              earlier the same day, the closed row is reopened instead.
+
+        The snapshot file is written inside the database transaction, so the
+        log and the table stay in sync when either of them fails.
+
+        Args:
+            job_ids: Iterable of job IDs seen in the scrape.
+            snapshot_date: Date of the scrape (date or YYYY-MM-DD). Defaults to today.
+
+        Returns:
+            Dict with the number of opened, reopened, seen and closed jobs,
+            or None if the update failed.
+        """
+        snapshot_date = _as_date(snapshot_date)
+        current_ids = {int(job_id) for job_id in job_ids if job_id is not None}
+
+        if not self.db.conn:
+            self.db.connect()
+        self.create_table()
+
+        day = snapshot_date.isoformat()
+        snapshot_path = None
+        try:
+            cursor = self.db.cursor
+            cursor.execute("SELECT job_id FROM job_lifecycle WHERE closed_at IS NULL;")
+            previous_open = {row[0] for row in cursor.fetchall()}
+
+            closed = previous_open - current_ids
+            started = current_ids - previous_open
+
+            # Look up past intervals of the started IDs only, through a temp table
+            # so the lookup stays incremental whatever the size of the history
+            cursor.execute("CREATE TEMP TABLE IF NOT EXISTS started_ids (job_id INTEGER PRIMARY KEY);")
+            cursor.execute("DELETE FROM started_ids;")
+            cursor.executemany("INSERT INTO started_ids (job_id) VALUES (?);", ((job_id,) for job_id in started))
+            cursor.execute(
+                """
+                SELECT job_id, MAX(closed_at) FROM job_lifecycle
+                WHERE job_id IN (SELECT job_id FROM started_ids)
+                GROUP BY job_id;
+                """
+            )
+            last_closed = dict(cursor.fetchall())
+            closed_today = {job_id for job_id, closed_at in last_closed.items() if closed_at == day}
+
+            cursor.executemany(
+                "UPDATE job_lifecycle SET last_seen = ? WHERE job_id = ? AND closed_at IS NULL;",
+                ((day, job_id) for job_id in current_ids & previous_open),
+            )
+            # A same-day closure was a scrape gap, not a closure: reopen that interval
+            cursor.executemany(
+                "UPDATE job_lifecycle SET last_seen = ?, closed_at = NULL WHERE job_id = ? AND closed_at = ?;",
+                ((day, job_id, day) for job_id in closed_today),
+            )
+            reopened = cursor.rowcount
+
+            insert_sql = """
+            INSERT OR IGNORE INTO job_lifecycle (job_id, first_seen, last_seen, closed_at)
+            VALUES (?, ?, ?, NULL);
+            """
+            cursor.executemany(
+                insert_sql,
+                ((job_id, day, day) for job_id in started if job_id not in last_closed),
+            )
+            opened = cursor.rowcount
+            cursor.executemany(
+                insert_sql,
+                ((job_id, day, day) for job_id in started - closed_today if job_id in last_closed),
+            )
+            reopened += cursor.rowcount
+
+            cursor.executemany(
+                "UPDATE job_lifecycle SET closed_at = ? WHERE job_id = ? AND closed_at IS NULL;",
+                ((day, job_id) for job_id in closed),
+            )
+            closed_count = cursor.rowcount
+            cursor.execute("DELETE FROM started_ids;")
+
+            snapshot_path = self.write_snapshot(current_ids, snapshot_date)
+            self.db.conn.commit()
+        except (sqlite3.Error, OSError) as e:
+            print(f"Error recording snapshot: {e}")
+            self.db.conn.rollback()
+            if snapshot_path is not None:
+                snapshot_path.unlink(missing_ok=True)
+            return None
+
+        summary = {
+            "opened": opened,
+            "reopened": reopened,
+            "seen": len(current_ids),
+            "closed": closed_count,
+        }
+        print(f"Recorded snapshot for {day}: {summary['opened']} opened, "
+              f"{summary['reopened']} reopened, {summary['seen']} seen, "
+              f"{summary['closed']} closed.")
+        return summary
+
+    def count_open_jobs(self, on_date):
+        """
+        Counts the jobs that were open on a given day.
+
+        Args:
+            on_date: Day to evaluate (date or YYYY-MM-DD).
+
+        Returns:
+            Number of open jobs.
+        """
+        if not self.db.conn:
+            self.db.connect()
+
+        day = _as_date(on_date).isoformat()
+        try:
+            self.db.cursor.execute(
+                """
+                SELECT COUNT(*) FROM job_lifecycle
+                WHERE first_seen <= ? AND (closed_at IS NULL OR closed_at > ?);
+                """,
+                (day, day),
+            )
+            return self.db.cursor.fetchone()[0]
+        except sqlite3.Error as e:
+            print(f"Error counting open jobs: {e}")
+            return 0
+
+    def open_jobs_over_time(self, start_date, end_date):
+        """
+        Counts open jobs for every day in a date range.
+
+        Args:
+            start_date: First day (date or YYYY-MM-DD).
+            end_date: Last day (date or YYYY-MM-DD).
+
+        Returns:
+            List of (YYYY-MM-DD, open_jobs) tuples.
+        """
+        if not self.db.conn:
+            self.db.connect()
+
+        query = """
+        WITH RECURSIVE days(day) AS (
+            SELECT ?
+            UNION ALL
+            SELECT date(day, '+1 day') FROM days WHERE day < ?
+        )
+        SELECT days.day, COUNT(job_lifecycle.job_id)
+        FROM days
+        LEFT JOIN job_lifecycle
+            ON job_lifecycle.first_seen <= days.day
+            AND (job_lifecycle.closed_at IS NULL OR job_lifecycle.closed_at > days.day)
+        GROUP BY days.day
+        ORDER BY days.day;
+        """
+        try:
+            self.db.cursor.execute(
+                query, (_as_date(start_date).isoformat(), _as_date(end_date).isoformat())
+            )
+            return self.db.cursor.fetchall()
+        except sqlite3.Error as e:
+            print(f"Error computing open jobs over time: {e}")
+            return []
+
+    def time_to_fill(self):
+        """
+        Returns the number of days each closed job stayed open.
+
+        A job that was closed and reopened has one entry per closed interval.
+
+        Returns:
+            List of (job_id, days_open) tuples.
+        """
+        if not self.db.conn:
+            self.db.connect()
+
+        try:
+            self.db.cursor.execute(
+                """
+                SELECT job_id, julianday(closed_at) - julianday(first_seen)
+                FROM job_lifecycle
+                WHERE closed_at IS NOT NULL;
+                """
+            )
+            return self.db.cursor.fetchall()
+        except sqlite3.Error as e:
+            print(f"Error computing time to fill: {e}")
+            return []
+
+
+def _as_date(value):
+    """Normalizes None, a date or a YYYY-MM-DD string to a date."""
+    if value is None:
+        return date.today()
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+if __name__ == "__main__":
+    db = DBConnector()
+    db.connect()
+    history = JobHistory(db)
+    history.create_table()
+
+    all_jobs = db.fetch_all_jobs()
+    if not all_jobs.empty:
+        history.record_snapshot(all_jobs["id"])
+        print(f"Open jobs today: {history.count_open_jobs(date.today())}")
+
+    db.disconnect()
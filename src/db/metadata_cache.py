@@ -0,0 +1,136 @@
+"""
+Metadata Cache - Remote Work Tracker
+=====================================
+Small JSON summary of the remote_jobs table, stored next to the database.
+
+The cache holds the row count, per-category counts, publication date bounds
+and the last-load watermark. It is refreshed at the end of every load, so
+commands that only list or inspect can answer from it without reading the
+table. It also stores the database file's modification time: if the
+database was written since (e.g. by an insert that skipped the refresh),
+the cache is stale and is rebuilt on read. Exports never use it.
+
+Keep this module free of heavy imports: it is on the CLI startup path.
+"""
+
+import json
+import os
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+
+def metadata_path(db_name):
+    """Returns the path of the metadata cache for a database file."""
+    return Path(f"{db_name}.meta.json")
+
+
+def _db_mtime_ns(db_name):
+    """Returns the database file's modification time in nanoseconds, or None if it is missing."""
+    try:
+        return os.stat(db_name).st_mtime_ns
+    except OSError:
+        return None
+
+
+def build_metadata(conn):
+    """
+    Computes the metadata with aggregate queries on an open connection.
+
+    Args:
+        conn: sqlite3 connection to the jobs database.
+
+    Returns:
+        Dict with row_count, categories, date bounds and last_load.
+    """
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT COUNT(*), MIN(publication_date), MAX(publication_date), MAX(ingestion_timestamp)
+        FROM remote_jobs;
+    """)
+    row_count, date_min, date_max, last_load = cursor.fetchone()
+
+    cursor.execute("""
+        SELECT category, COUNT(*) FROM remote_jobs
+        WHERE category IS NOT NULL
+        GROUP BY category
+        ORDER BY category;
+    """)
+    categories = dict(cursor.fetchall())
+
+    return {
+        "row_count": row_count,
+        "categories": categories,
+        "publication_date_min": date_min,
+        "publication_date_max": date_max,
+        "last_load": last_load,
+        "updated_at": datetime.now().isoformat(),
+    }
+
+
+def refresh_metadata(conn, db_name):
+    """
+    Rebuilds the metadata cache from the database and writes it to disk.
+
+    Args:
+        conn: sqlite3 connection to the jobs database (changes committed).
+        db_name: Database file name, used to locate the cache file.
+
+    Returns:
+        The metadata dict, or None if it could not be built. The dict is
+        returned even if the cache file could not be written.
+    """
+    try:
+        metadata = build_metadata(conn)
+    except sqlite3.Error as e:
+        print(f"Error building metadata cache: {e}")
+        return None
+    metadata["db_mtime_ns"] = _db_mtime_ns(db_name)
+
+    path = metadata_path(db_name)
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(metadata, f, indent=2)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        # e.g. a read-only database directory: answer without caching
+        print(f"Could not write metadata cache {path}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+    return metadata
+
+
+def load_metadata(db_name):
+    """
+    Reads the metadata cache, rebuilding it if it is missing or stale.
+
+    The cache is refreshed once at the end of each ETL or pipeline load. It
+    is stale when the database file was modified after it was built.
+
+    Args:
+        db_name: Database file name.
+
+    Returns:
+        The metadata dict, or None if the database doesn't exist.
+    """
+    db_mtime_ns = _db_mtime_ns(db_name)
+    if db_mtime_ns is None:
+        return None
+
+    try:
+        with open(metadata_path(db_name), encoding="utf-8") as f:
+            metadata = json.load(f)
+        if metadata.get("db_mtime_ns") == db_mtime_ns:
+            return metadata
+    except (OSError, ValueError):
+        pass
+
+    # Missing or stale cache: rebuild it with aggregate queries instead of a full read
+    conn = sqlite3.connect(f"{Path(db_name).resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        return refresh_metadata(conn, db_name)
+    finally:
+        conn.close()
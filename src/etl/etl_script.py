@@ -1,7 +1,13 @@
+import argparse
 import pandas as pd
 import numpy as np
 from datetime import datetime
+from db_connector import DBConnector
+from job_history import JobHistory
+from instrumentation import timed, count_rows, reporting_run
+from job_record import CSV_HEADERS
 
+@timed("extract")
 def extract_data(file_path: str) -> pd.DataFrame:
     """Extracts raw job data from a CSV file into a Pandas DataFrame."""
     try:
@@ -15,6 +21,7 @@ def extract_data(file_path: str) -> pd.DataFrame:
         print(f"Error extracting data: {e}")
         return pd.DataFrame()              
 
+@timed("transform")
 def transform_data(df):
     """Transforms and cleans the raw job data DataFrame."""
     if df.empty:
@@ -22,20 +29,7 @@ def transform_data(df):
         return df
 
     # Rename columns to match database schema
-    df = df.rename(columns={
-        "Job ID": "id",
-        "Job Title": "job_title",
-        "Company Name": "company_name",
-        "Publication Date": "publication_date",
-        "Job Type": "job_type",
-        "Category": "category",
-        "Candidate Required Location": "candidate_required_location",
-        "Salary Range": "salary_range",
-        "Job Description": "job_description",
-        "Source URL": "source_url",
-        "Company Logo": "company_logo",
-        "Job Board": "job_board"
-    })
+    df = df.rename(columns=CSV_HEADERS)
 
     # Handle missing values
     df = df.replace({np.nan: None})
@@ -70,27 +64,47 @@ def transform_data(df):
     print("Data transformation complete.")
     return df
 
+@timed("load")
 def load_data(df, db_connector):
-    """Loads the transformed DataFrame into the database using DBConnector."""
+    """Loads the transformed DataFrame into the database using DBConnector.
+       Returns the number of records loaded, or None if the insert failed.
+    """
     
     if df.empty:
         print("No data to load.")
-        return
+        return 0
 
     print(f"Loading {len(df)} records into the database...")
-    db_connector.insert_jobs(df)
+    loaded = db_connector.insert_jobs(df)
+    if loaded is None:
+        return None
+    count_rows(len(df))
     print("Data loading complete.")
+    return loaded
 
 if __name__ == "__main__":
-    print("Running ETL script in standalone mode.")
-    csv_file = "remotive_jobs_extended.csv"
-    extracted_df = extract_data(csv_file)
-    transformed_df = transform_data(extracted_df)
-    if not transformed_df.empty:
-        db = DBConnector()
-        db.connect()
-        db.create_table()
-        load_data(transformed_df, db)
-        db.disconnect()
-    else:
-        print("ETL process completed with no data to load.")                
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Load the scraped CSV into the database")
+    # The CSV may come from a partial scrape, and a snapshot missing a category
+    # would close every job in it, so history is only recorded on request
+    parser.add_argument("--record-history", action="store_true",
+                        help="Record a job history snapshot. Only use it when the CSV covers every category.")
+    args = parser.parse_args()
+
+    with reporting_run():
+        print("Running ETL script in standalone mode.")
+        csv_file = "remotive_jobs_extended.csv"
+        extracted_df = extract_data(csv_file)
+        transformed_df = transform_data(extracted_df)
+        if not transformed_df.empty:
+            db = DBConnector()
+            db.connect()
+            db.create_table()
+            loaded = load_data(transformed_df, db)
+            if loaded is None:
+                print("⚠️ Load failed, job history snapshot skipped.")
+            elif args.record_history:
+                JobHistory(db).record_snapshot(transformed_df["id"])
+            db.refresh_metadata()
+            db.disconnect()
+        else:
+            print("ETL process completed with no data to load.")
@@ -8,18 +8,83 @@ Author: Sohia Khaled Abbas
 Date: 2025-10-18
 """
 
-import pandas as pd
 import argparse
+import csv
+import hashlib
+import json
 import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
+from urllib.parse import quote
 from db_connector import DBConnector
+from metadata_cache import load_metadata
 from utils import setup_logging
+from instrumentation import timed, count_rows, reporting_run
+
+# pandas is imported inside the export methods that need it, so --help and
+# metadata commands don't pay its import cost
 
-# Initialize logger
-setup_logging("export_data.log", logging.INFO)
 logger = logging.getLogger(__name__)
 
+# SQL expression for each supported shard key
+SHARD_KEYS = {
+    'category': "category",
+    'month': "substr(publication_date, 1, 7)",
+}
+
+# Hive's directory name for NULL partition values
+HIVE_DEFAULT_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+
+def _export_shard(db_name, partition_by, values, export_dir, output_path):
+    """
+    Writes one shard of the remote_jobs table to CSV. Runs in a worker process.
+    
+    Each worker opens its own read-only connection and streams rows straight
+    to the file, so shards never hold the full table in memory.
+    
+    Args:
+        db_name: Name of the SQLite database file.
+        partition_by: Shard keys, e.g. ('category', 'month').
+        values: Value of each shard key for this shard.
+        export_dir: Root directory of the export, where the manifest is written.
+        output_path: Path of the CSV file to write.
+    
+    Returns:
+        Manifest entry with the shard's partition values, path relative to
+        `export_dir`, row count and checksum.
+    """
+    where = " AND ".join(f"{SHARD_KEYS[key]} IS ?" for key in partition_by)
+    
+    db = DBConnector(db_name)
+    db.connect(read_only=True)
+    rows = 0
+    try:
+        cursor = db.conn.execute(f"SELECT * FROM remote_jobs WHERE {where} ORDER BY id;", values)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(description[0] for description in cursor.description)
+            for batch in iter(lambda: cursor.fetchmany(1000), []):
+                writer.writerows(batch)
+                rows += len(batch)
+    finally:
+        db.disconnect()
+    
+    sha256 = hashlib.sha256()
+    with open(output_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            sha256.update(chunk)
+    
+    return {
+        'partition': dict(zip(partition_by, values)),
+        'path': output_path.relative_to(export_dir).as_posix(),
+        'rows': rows,
+        'bytes': output_path.stat().st_size,
+        'sha256': sha256.hexdigest(),
+    }
+
 
 class DataExporter:
     """
@@ -40,9 +105,24 @@ class DataExporter:
         """
         self.db = DBConnector(db_name)
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(exist_ok=True)
         logger.info(f"DataExporter initialized. Output directory: {self.output_dir}")
     
+    def _output_path(self, filename):
+        """Returns the path for an export file, creating the output directory on first use."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        return self.output_dir / filename
+    
+    def get_metadata(self):
+        """
+        Returns the cached table metadata, rebuilding it if it is missing or stale.
+        
+        Returns:
+            Dict with row_count, categories, date bounds and last_load, or None
+            if the database doesn't exist.
+        """
+        return load_metadata(self.db.db_name)
+    
+    @timed("export_all_jobs")
     def export_all_jobs(self, filename=None):
         """
         Export all jobs from the database to a CSV file.
@@ -74,14 +154,16 @@ class DataExporter:
             filename += '.csv'
         
         # Export to CSV
-        output_path = self.output_dir / filename
+        output_path = self._output_path(filename)
         df.to_csv(output_path, index=False, encoding='utf-8')
+        count_rows(len(df))
         
         logger.info(f"Successfully exported {len(df)} records to {output_path}")
         print(f"✅ Exported {len(df)} jobs to: {output_path}")
         
         return output_path
     
+    @timed("export_by_category")
     def export_by_category(self, category, filename=None):
         """
         Export jobs filtered by category.
@@ -95,18 +177,11 @@ class DataExporter:
         """
         logger.info(f"Exporting jobs for category: {category}")
         
-        # Connect to database and fetch all jobs
+        # Connect to database and fetch only this category
         self.db.connect()
-        df = self.db.fetch_all_jobs()
+        df_filtered = self.db.fetch_jobs_by_category(category)
         self.db.disconnect()
         
-        if df.empty:
-            logger.warning("No data found in database. Export aborted.")
-            return None
-        
-        # Filter by category
-        df_filtered = df[df['category'] == category]
-        
         if df_filtered.empty:
             logger.warning(f"No jobs found for category: {category}")
             print(f"⚠️ No jobs found for category: {category}")
@@ -123,14 +198,16 @@ class DataExporter:
             filename += '.csv'
         
         # Export to CSV
-        output_path = self.output_dir / filename
+        output_path = self._output_path(filename)
         df_filtered.to_csv(output_path, index=False, encoding='utf-8')
+        count_rows(len(df_filtered))
         
         logger.info(f"Successfully exported {len(df_filtered)} records for category '{category}' to {output_path}")
         print(f"✅ Exported {len(df_filtered)} jobs for '{category}' to: {output_path}")
         
         return output_path
     
+    @timed("export_by_date_range")
     def export_by_date_range(self, start_date, end_date, filename=None):
         """
         Export jobs within a specific date range.
@@ -143,6 +220,8 @@ class DataExporter:
         Returns:
             Path to the exported CSV file.
         """
+        import pandas as pd
+        
         logger.info(f"Exporting jobs from {start_date} to {end_date}")
         
         # Connect to database and fetch all jobs
@@ -178,14 +257,16 @@ class DataExporter:
             filename += '.csv'
         
         # Export to CSV
-        output_path = self.output_dir / filename
+        output_path = self._output_path(filename)
         df_filtered.to_csv(output_path, index=False, encoding='utf-8')
+        count_rows(len(df_filtered))
         
         logger.info(f"Successfully exported {len(df_filtered)} records for date range to {output_path}")
         print(f"✅ Exported {len(df_filtered)} jobs from {start_date} to {end_date} to: {output_path}")
         
         return output_path
     
+    @timed("export_summary_statistics")
     def export_summary_statistics(self, filename=None):
         """
         Export summary statistics about the job data.
@@ -196,6 +277,8 @@ class DataExporter:
         Returns:
             Path to the exported CSV file.
         """
+        import pandas as pd
+        
         logger.info("Generating summary statistics...")
         
         # Connect to database and fetch all jobs
@@ -269,14 +352,16 @@ class DataExporter:
             filename += '.csv'
         
         # Export to CSV
-        output_path = self.output_dir / filename
+        output_path = self._output_path(filename)
         summary_df.to_csv(output_path, index=False, encoding='utf-8')
+        count_rows(len(summary_df))
         
         logger.info(f"Successfully exported summary statistics to {output_path}")
         print(f"✅ Exported summary statistics to: {output_path}")
         
         return output_path
     
+    @timed("export_for_powerbi")
     def export_for_powerbi(self, filename=None):
         """
         Export data optimized for Power BI import.
@@ -288,6 +373,8 @@ class DataExporter:
         Returns:
             Path to the exported CSV file.
         """
+        import pandas as pd
+        
         logger.info("Exporting data optimized for Power BI...")
         
         # Connect to database and fetch all jobs
@@ -353,13 +440,111 @@ class DataExporter:
             filename += '.csv'
         
         # Export to CSV
-        output_path = self.output_dir / filename
+        output_path = self._output_path(filename)
         df_powerbi.to_csv(output_path, index=False, encoding='utf-8')
+        count_rows(len(df_powerbi))
         
         logger.info(f"Successfully exported {len(df_powerbi)} records optimized for Power BI to {output_path}")
         print(f"✅ Exported {len(df_powerbi)} jobs (Power BI optimized) to: {output_path}")
         
         return output_path
+    
+    @timed("export_sharded")
+    def export_sharded(self, partition_by=('category', 'month'), dirname=None, max_workers=None):
+        """
+        Export the table as one CSV file per shard, written in parallel.
+        
+        Shards are laid out in Hive-style directories, e.g.
+        `category=Design/month=2025-10/part-0000.csv`, and a `_manifest.json`
+        with each shard's row count and SHA-256 checksum is written at the root.
+        Shard paths in the manifest are relative to it, so the export can be
+        moved as a whole. Each shard is queried and written by its own worker
+        process. `DBConnector.create_table` indexes (category, month) and
+        month, so every combination of shard keys is an index search.
+        
+        Args:
+            partition_by: Shard keys, any of 'category' and 'month'.
+            dirname: Custom directory name for the export. If None, generates timestamp-based name.
+                The directory must not exist or be empty, so no stale shard is
+                left next to a new manifest.
+            max_workers: Number of worker processes. Defaults to the CPU count.
+        
+        Returns:
+            Path to the manifest file.
+        """
+        partition_by = tuple(partition_by)
+        unknown = [key for key in partition_by if key not in SHARD_KEYS]
+        if not partition_by or unknown:
+            raise ValueError(f"Invalid shard keys {list(partition_by)}. Choose from: {', '.join(SHARD_KEYS)}")
+        
+        # Generate directory name if not provided
+        if dirname is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            dirname = f"remote_jobs_sharded_{timestamp}"
+        export_dir = self._output_path(dirname)
+        if export_dir.exists() and any(export_dir.iterdir()):
+            logger.warning(f"Export directory {export_dir} is not empty. Export aborted.")
+            print(f"⚠️ Export directory is not empty: {export_dir}")
+            return None
+        
+        logger.info(f"Starting sharded export by {', '.join(partition_by)}...")
+        
+        # Connect to database and list the shards
+        keys_sql = ", ".join(SHARD_KEYS[key] for key in partition_by)
+        self.db.connect(read_only=True)
+        try:
+            shards = self.db.conn.execute(
+                f"SELECT {keys_sql}, COUNT(*) FROM remote_jobs GROUP BY {keys_sql} ORDER BY {keys_sql};"
+            ).fetchall()
+        except Exception as e:
+            logger.error(f"Error listing shards: {e}")
+            shards = []
+        finally:
+            self.db.disconnect()
+        
+        if not shards:
+            logger.warning("No data found in database. Export aborted.")
+            return None
+        
+        # Submit one task per shard
+        entries = []
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = []
+            for shard in shards:
+                values = shard[:-1]
+                shard_dir = export_dir.joinpath(*(
+                    f"{key}={HIVE_DEFAULT_PARTITION if value is None else quote(str(value), safe=' ')}"
+                    for key, value in zip(partition_by, values)
+                ))
+                futures.append(pool.submit(
+                    _export_shard, self.db.db_name, partition_by, values, export_dir,
+                    shard_dir / "part-0000.csv"
+                ))
+            
+            for future in as_completed(futures):
+                entries.append(future.result())
+        
+        entries.sort(key=lambda entry: entry['path'])
+        total_rows = sum(entry['rows'] for entry in entries)
+        
+        # Write manifest
+        manifest = {
+            'created_at': datetime.now().isoformat(),
+            'database': self.db.db_name,
+            'partition_by': list(partition_by),
+            'shard_count': len(entries),
+            'total_rows': total_rows,
+            'shards': entries,
+        }
+        manifest_path = export_dir / "_manifest.json"
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        count_rows(total_rows)
+        
+        logger.info(f"Successfully exported {total_rows} records in {len(entries)} shards to {export_dir}")
+        print(f"✅ Exported {total_rows} jobs in {len(entries)} shards to: {export_dir}")
+        
+        return manifest_path
 
 
 def main():
@@ -388,6 +573,13 @@ Examples:
   
   # Export with custom filename
   python export_data.py --all --output my_jobs.csv
+  
+  # Export one file per category and month, in parallel
+  python export_data.py --sharded --partition-by category month --workers 8
+  
+  # List categories and table info from the metadata cache
+  python export_data.py --list-categories
+  python export_data.py --info
         """
     )
     
@@ -401,6 +593,19 @@ Examples:
                         help='Export summary statistics')
     parser.add_argument('--powerbi', action='store_true',
                         help='Export data optimized for Power BI')
+    parser.add_argument('--sharded', action='store_true',
+                        help='Export one file per shard into Hive-style directories, in parallel')
+    parser.add_argument('--partition-by', nargs='+', choices=list(SHARD_KEYS),
+                        default=['category', 'month'],
+                        help='Shard keys for --sharded (default: category month)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes for --sharded (default: CPU count)')
+    parser.add_argument('--list-categories', action='store_true',
+                        help='List categories with job counts (from the metadata cache)')
+    parser.add_argument('--info', action='store_true',
+                        help='Show row count, date bounds and last load (from the metadata cache)')
+    parser.add_argument('--refresh-metadata', action='store_true',
+                        help='Rebuild the metadata cache from the database')
     parser.add_argument('--output', '-o', type=str,
                         help='Custom output filename')
     parser.add_argument('--db', type=str, default='remote_jobs.db',
@@ -410,24 +615,58 @@ Examples:
     
     args = parser.parse_args()
     
-    # Create exporter instance
-    exporter = DataExporter(db_name=args.db, output_dir=args.output_dir)
+    # Metadata commands answer from the cache and skip logging and run reports
+    if args.list_categories or args.info or args.refresh_metadata:
+        if args.refresh_metadata:
+            # Connecting to a missing file would create an empty database
+            metadata = None
+            if Path(args.db).is_file():
+                db = DBConnector(args.db)
+                metadata = db.refresh_metadata()
+                db.disconnect()
+        else:
+            metadata = load_metadata(args.db)
+        
+        if metadata is None:
+            print(f"⚠️ No metadata available for database: {args.db}")
+        elif args.list_categories:
+            for category, count in metadata['categories'].items():
+                print(f"{category}: {count}")
+        else:
+            print(f"Database:     {args.db}")
+            print(f"Total jobs:   {metadata['row_count']}")
+            print(f"Categories:   {len(metadata['categories'])}")
+            print(f"Published:    {metadata['publication_date_min']} to {metadata['publication_date_max']}")
+            print(f"Last load:    {metadata['last_load']}")
+        return
     
-    # Execute export based on arguments
-    if args.all:
-        exporter.export_all_jobs(filename=args.output)
-    elif args.category:
-        exporter.export_by_category(category=args.category, filename=args.output)
-    elif args.date_range:
-        start_date, end_date = args.date_range
-        exporter.export_by_date_range(start_date=start_date, end_date=end_date, filename=args.output)
-    elif args.summary:
-        exporter.export_summary_statistics(filename=args.output)
-    elif args.powerbi:
-        exporter.export_for_powerbi(filename=args.output)
-    else:
+    if not (args.all or args.category or args.date_range or args.summary
+            or args.powerbi or args.sharded):
         print("⚠️ No export option specified. Use --help for usage information.")
         parser.print_help()
+        return
+    
+    setup_logging("export_data.log", logging.INFO)
+    
+    with reporting_run():
+        # Create exporter instance
+        exporter = DataExporter(db_name=args.db, output_dir=args.output_dir)
+        
+        # Execute export based on arguments
+        if args.all:
+            exporter.export_all_jobs(filename=args.output)
+        elif args.category:
+            exporter.export_by_category(category=args.category, filename=args.output)
+        elif args.date_range:
+            start_date, end_date = args.date_range
+            exporter.export_by_date_range(start_date=start_date, end_date=end_date, filename=args.output)
+        elif args.summary:
+            exporter.export_summary_statistics(filename=args.output)
+        elif args.powerbi:
+            exporter.export_for_powerbi(filename=args.output)
+        elif args.sharded:
+            exporter.export_sharded(partition_by=args.partition_by, dirname=args.output,
+                                    max_workers=args.workers)
 
 
 if __name__ == "__main__":
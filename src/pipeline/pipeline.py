@@ -0,0 +1,340 @@
+"""
+Pipeline Runner - Remote Work Tracker
+======================================
+Runs scrape -> transform -> load -> export as one command.
+
+The stages run concurrently and are connected by bounded queues:
+    * fetch      one thread calling the Remotive API, category by category
+    * transform  a process pool running `transform_data` on each category
+    * load       one thread inserting transformed batches into SQLite
+    * export     runs once the load has finished
+
+While category B is being fetched, category A is transformed and loaded.
+When the queues are full, the upstream stage blocks until the downstream
+stage catches up, so at most a few category batches are held in memory.
+If any stage fails or the run is interrupted, a stop event unblocks the
+other stages so the run always ends.
+
+Usage:
+    python pipeline.py run
+    python pipeline.py run --categories software-dev data --export powerbi
+"""
+
+import argparse
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent
+for module_dir in ("db", "etl", "scraper", "utils"):
+    if str(SRC_DIR / module_dir) not in sys.path:
+        sys.path.insert(0, str(SRC_DIR / module_dir))
+
+from db_connector import DBConnector
+from etl_script import transform_data, load_data
+from export_data import DataExporter
+from job_history import JobHistory
+from job_record import records_to_dataframe
+from remotive_api_scraper import get_remotive_categories
+from sources import RemotiveSource
+from instrumentation import stage, count_rows, record_stage, reporting_run
+from utils import setup_logging
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of a queue's stream
+_SENTINEL = None
+
+# How often blocked queue operations check whether the run is stopping, in seconds
+QUEUE_POLL_SECONDS = 0.5
+
+EXPORT_CHOICES = ("all", "summary", "powerbi", "none")
+
+
+def _transform_batch(df):
+    """Runs transform_data in a worker process and returns it with its duration."""
+    start = time.perf_counter()
+    # Call the undecorated function: a worker has its own run report, which is
+    # never written, and would dump orphan profiles. The parent records the
+    # duration with record_stage instead.
+    transformed = transform_data.__wrapped__(df)
+    return transformed, time.perf_counter() - start
+
+
+class Pipeline:
+    """
+    Orchestrates the scrape, transform, load and export stages.
+
+    Attributes:
+        db_name (str): SQLite database file.
+        categories (list): Category slugs to scrape. None scrapes every category.
+        limit (int): Maximum jobs requested per category.
+        workers (int): Number of transform worker processes.
+        queue_size (int): Capacity of each inter-stage queue.
+        fetch_delay (float): Pause between API requests, in seconds.
+        export (str): Export to run after loading (all, summary, powerbi, none).
+        output_dir (str): Output directory for exported files.
+        snapshot_dir (str): Root directory of the job history snapshot log.
+    """
+
+    def __init__(self, db_name="remote_jobs.db", categories=None, limit=5000,
+                 workers=None, queue_size=2, fetch_delay=2.0, export="powerbi",
+                 output_dir="exports", snapshot_dir="data/snapshots"):
+        """
+        Initialize the Pipeline.
+
+        Args:
+            db_name: SQLite database file.
+            categories: Category slugs to scrape. None scrapes every category.
+            limit: Maximum jobs requested per category.
+            workers: Number of transform worker processes. Defaults to the CPU count.
+            queue_size: Capacity of each inter-stage queue.
+            fetch_delay: Pause between API requests, in seconds.
+            export: Export to run after loading (all, summary, powerbi, none).
+            output_dir: Output directory for exported files.
+            snapshot_dir: Root directory of the job history snapshot log.
+        """
+        self.db_name = db_name
+        self.categories = categories
+        self.limit = limit
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+        self.fetch_delay = fetch_delay
+        self.export = export
+        self.output_dir = output_dir
+        self.snapshot_dir = snapshot_dir
+        self.loaded_rows = 0
+        self.loaded_categories = set()
+        self.failed_categories = set()
+        self._stop = threading.Event()
+
+    def _put(self, q, item):
+        """Puts an item on a queue. Returns False if the run stopped while waiting."""
+        while not self._stop.is_set():
+            try:
+                q.put(item, timeout=QUEUE_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, q):
+        """Gets an item from a queue. Returns the sentinel if the run stopped while waiting."""
+        while not self._stop.is_set():
+            try:
+                return q.get(timeout=QUEUE_POLL_SECONDS)
+            except queue.Empty:
+                continue
+        return _SENTINEL
+
+    def _fetch(self, categories, fetch_queue):
+        """Fetch stage: scrapes each category and queues its records as a remote_jobs DataFrame."""
+        source = RemotiveSource(limit=self.limit)
+        try:
+            for i, category_slug in enumerate(categories):
+                # Pause between category requests to be polite, unless the run is stopping
+                if i and self.fetch_delay and self._stop.wait(self.fetch_delay):
+                    break
+                print(f"Scraping category: {category_slug}")
+                try:
+                    with stage("scrape"):
+                        category_data = records_to_dataframe(source.fetch_category(category_slug))
+                        count_rows(len(category_data))
+                except Exception as e:
+                    logger.error(f"Failed to fetch category '{category_slug}': {e}")
+                    self.failed_categories.add(category_slug)
+                    continue
+                if category_data.empty:
+                    # RemotiveSource yields no records on request errors too
+                    logger.warning(f"No jobs fetched for category '{category_slug}'")
+                    self.failed_categories.add(category_slug)
+                elif not self._put(fetch_queue, (category_slug, category_data)):
+                    break
+        finally:
+            self._put(fetch_queue, _SENTINEL)
+
+    def _load(self, load_queue, categories, record_history):
+        """Load stage: waits for each transformed batch and inserts it into the database."""
+        db = DBConnector(self.db_name)
+        try:
+            db.connect()
+            if db.conn is None:
+                raise RuntimeError(f"Could not connect to database: {self.db_name}")
+            db.create_table()
+            job_ids = set()
+
+            for category_slug, future in iter(lambda: self._get(load_queue), _SENTINEL):
+                try:
+                    transformed_df, seconds = future.result()
+                    record_stage("transform", seconds, len(transformed_df))
+                    if load_data(transformed_df, db) is None:
+                        raise RuntimeError("insert failed")
+                    job_ids.update(transformed_df["id"].dropna())
+                    self.loaded_rows += len(transformed_df)
+                    self.loaded_categories.add(category_slug)
+                except Exception as e:
+                    # Keep draining the queue so upstream stages never block forever
+                    logger.error(f"Failed to process category '{category_slug}': {e}")
+                    self.failed_categories.add(category_slug)
+
+            if record_history:
+                # A snapshot missing any category would close every job in it
+                if self._stop.is_set() or self.loaded_categories != set(categories):
+                    missing = sorted(set(categories) - self.loaded_categories)
+                    print(f"⚠️ Job history snapshot skipped: {len(missing)} categories not loaded "
+                          f"({', '.join(missing) or 'run stopped'}).")
+                else:
+                    JobHistory(db, self.snapshot_dir).record_snapshot(job_ids)
+
+            # One cache refresh per load, after its last write to the database
+            db.refresh_metadata()
+        except Exception as e:
+            logger.error(f"Load stage failed: {e}")
+            self._stop.set()
+        finally:
+            db.disconnect()
+
+    def _export(self):
+        """Export stage: writes the requested export from the loaded database."""
+        if self.export == "none":
+            return None
+
+        exporter = DataExporter(db_name=self.db_name, output_dir=self.output_dir)
+        if self.export == "all":
+            return exporter.export_all_jobs()
+        if self.export == "summary":
+            return exporter.export_summary_statistics()
+        return exporter.export_for_powerbi()
+
+    def run(self):
+        """
+        Runs the full pipeline.
+
+        Returns:
+            Number of job records loaded into the database.
+        """
+        categories = self.categories or get_remotive_categories()
+        if not categories:
+            print("Could not retrieve categories. Exiting.")
+            return 0
+
+        # A partial scrape would mark every job of the skipped categories as closed
+        record_history = not self.categories
+
+        self.loaded_rows = 0
+        self.loaded_categories = set()
+        self.failed_categories = set()
+        self._stop = threading.Event()
+        fetch_queue = queue.Queue(maxsize=self.queue_size)
+        load_queue = queue.Queue(maxsize=self.queue_size)
+
+        print(f"Running pipeline for {len(categories)} categories with {self.workers} transform workers.")
+        with stage("pipeline"):
+            # Spawned workers don't inherit the fetch and load threads' locks,
+            # which a fork from this multi-threaded process would copy mid-use
+            with ProcessPoolExecutor(max_workers=self.workers, mp_context=get_context("spawn")) as pool:
+                fetcher = threading.Thread(target=self._fetch, args=(categories, fetch_queue),
+                                           name="fetch", daemon=True)
+                loader = threading.Thread(target=self._load,
+                                          args=(load_queue, categories, record_history),
+                                          name="load", daemon=True)
+                fetcher.start()
+                loader.start()
+
+                # Transform dispatch: the bounded load queue caps the batches in flight
+                try:
+                    for category_slug, category_data in iter(lambda: self._get(fetch_queue), _SENTINEL):
+                        future = pool.submit(_transform_batch, category_data)
+                        if not self._put(load_queue, (category_slug, future)):
+                            break
+                except BaseException:
+                    # Ctrl-C or a dispatch error: unblock the fetch and load stages
+                    self._stop.set()
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    raise
+                finally:
+                    self._put(load_queue, _SENTINEL)
+                    fetcher.join()
+                    loader.join()
+
+            if self._stop.is_set():
+                raise RuntimeError("Pipeline stopped because the load stage failed. See the log for details.")
+
+            with stage("export"):
+                self._export()
+
+        if self.failed_categories:
+            print(f"⚠️ {len(self.failed_categories)} categories failed: "
+                  f"{', '.join(sorted(self.failed_categories))}")
+        print(f"✅ Pipeline complete. Loaded {self.loaded_rows} jobs into {self.db_name}.")
+        return self.loaded_rows
+
+
+def main():
+    """
+    Main function to handle command-line interface for the pipeline.
+    """
+    parser = argparse.ArgumentParser(
+        description="Remote Work Tracker pipeline",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Scrape every category, load it and export for Power BI
+  python pipeline.py run
+
+  # Scrape two categories with 4 transform workers, no export
+  python pipeline.py run --categories software-dev data --workers 4 --export none
+        """
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    run_parser = subparsers.add_parser("run", help="Run scrape -> transform -> load -> export")
+    run_parser.add_argument("--categories", nargs="+", metavar="SLUG",
+                            help="Category slugs to scrape (default: all categories)")
+    run_parser.add_argument("--limit", type=int, default=5000,
+                            help="Maximum jobs per category (default: 5000)")
+    run_parser.add_argument("--workers", type=int, default=None,
+                            help="Transform worker processes (default: CPU count)")
+    run_parser.add_argument("--queue-size", type=int, default=2,
+                            help="Batches buffered between stages (default: 2)")
+    run_parser.add_argument("--fetch-delay", type=float, default=2.0,
+                            help="Seconds between API requests (default: 2)")
+    run_parser.add_argument("--export", choices=EXPORT_CHOICES, default="powerbi",
+                            help="Export to run after loading (default: powerbi)")
+    run_parser.add_argument("--db", type=str, default="remote_jobs.db",
+                            help="Database file name (default: remote_jobs.db)")
+    run_parser.add_argument("--output-dir", type=str, default="exports",
+                            help="Output directory (default: exports)")
+    run_parser.add_argument("--snapshot-dir", type=str, default="data/snapshots",
+                            help="Job history snapshot directory (default: data/snapshots)")
+
+    args = parser.parse_args()
+
+    if args.command != "run":
+        parser.print_help()
+        return
+
+    setup_logging("pipeline.log", logging.INFO)
+    pipeline = Pipeline(
+        db_name=args.db,
+        categories=args.categories,
+        limit=args.limit,
+        workers=args.workers,
+        queue_size=args.queue_size,
+        fetch_delay=args.fetch_delay,
+        export=args.export,
+        output_dir=args.output_dir,
+        snapshot_dir=args.snapshot_dir,
+    )
+    with reporting_run():
+        pipeline.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Job Record - Remote Work Tracker
+=================================
+Canonical, board-independent schema for a scraped job posting.
+
+`JobRecord` is a NamedTuple: it has no per-instance `__dict__`, its fields
+are in `remote_jobs` column order, and it can be passed straight to
+`sqlite3.executemany` without building intermediate dicts.
+"""
+
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+
+class JobRecord(NamedTuple):
+    """A single job posting in the `remote_jobs` schema."""
+
+    id: int
+    job_title: str
+    company_name: str
+    publication_date: Optional[str]
+    job_type: Optional[str] = None
+    category: Optional[str] = None
+    candidate_required_location: Optional[str] = None
+    salary_range: Optional[str] = None
+    job_description: Optional[str] = None
+    source_url: Optional[str] = None
+    company_logo: Optional[str] = None
+    job_board: Optional[str] = None
+    ingestion_timestamp: Optional[str] = None
+
+
+# Column order of `remote_jobs`
+COLUMNS = JobRecord._fields
+
+# Headers used by the scraper CSV output, mapped to JobRecord fields
+CSV_HEADERS = {
+    "Job ID": "id",
+    "Job Title": "job_title",
+    "Company Name": "company_name",
+    "Publication Date": "publication_date",
+    "Job Type": "job_type",
+    "Category": "category",
+    "Candidate Required Location": "candidate_required_location",
+    "Salary Range": "salary_range",
+    "Job Description": "job_description",
+    "Source URL": "source_url",
+    "Company Logo": "company_logo",
+    "Job Board": "job_board",
+}
+
+
+def normalize_date(date_str):
+    """Converts an ISO-like date string to ISO format, or None if it can't be parsed."""
+    if not date_str:
+        return None
+    try:
+        return datetime.fromisoformat(str(date_str).replace("Z", "+00:00")).isoformat()
+    except ValueError:
+        return None
+
+
+def records_to_dataframe(records):
+    """
+    Builds a Pandas DataFrame in the `remote_jobs` schema from JobRecords.
+
+    Args:
+        records: Iterable of JobRecord.
+    """
+    import pandas as pd
+    return pd.DataFrame.from_records(list(records), columns=COLUMNS)
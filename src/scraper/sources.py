@@ -0,0 +1,296 @@
+"""
+Job Board Sources - Remote Work Tracker
+========================================
+Plugin interface for job board scrapers.
+
+Each board is a `JobSource` adapter that streams `JobRecord`s in the
+canonical `remote_jobs` schema, so no board needs its own column mapping or
+rename step downstream. A `SourceRegistry` runs the registered adapters
+concurrently and merges their records into one stream.
+
+Adding a board:
+    class ExampleSource(JobSource):
+        name = "example"
+
+        def fetch(self):
+            for job in call_example_api():
+                yield JobRecord(id=job["id"], job_title=job["title"], ...)
+
+    registry = SourceRegistry()
+    registry.register(RemotiveSource())
+    registry.register(ExampleSource())
+    db.insert_records(registry.run())
+"""
+
+import json
+import logging
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+
+import requests
+
+from job_record import JobRecord, normalize_date
+
+logger = logging.getLogger(__name__)
+
+# How often a blocked adapter checks whether the consumer has stopped, in seconds
+QUEUE_POLL_SECONDS = 0.5
+
+
+class JobSource(ABC):
+    """
+    Base class for job board adapters.
+
+    Subclasses set `name` and implement `fetch()`.
+    """
+
+    name = None
+
+    @abstractmethod
+    def fetch(self):
+        """Yields the board's job postings as JobRecords."""
+
+
+class RemotiveSource(JobSource):
+    """
+    Adapter for the Remotive.com public API.
+
+    Attributes:
+        categories (list): Category slugs to fetch. None fetches all jobs in one request.
+        search (str): Optional search term.
+        limit (int): Maximum jobs per request.
+        delay (float): Pause between category requests, in seconds.
+    """
+
+    name = "remotive"
+    job_board = "Remotive.com"
+    api_url = "https://remotive.com/api/remote-jobs"
+    categories_url = "https://remotive.com/api/remote-jobs/categories"
+
+    def __init__(self, categories=None, search=None, limit=None, delay=2.0):
+        """
+        Initialize the RemotiveSource.
+
+        Args:
+            categories: Category slugs to fetch. None fetches all jobs in one request.
+            search: Optional search term.
+            limit: Maximum jobs per request.
+            delay: Pause between category requests, in seconds.
+        """
+        self.categories = categories
+        self.search = search
+        self.limit = limit
+        self.delay = delay
+
+    def get_categories(self):
+        """Returns the category slugs offered by the API."""
+        try:
+            response = requests.get(self.categories_url)
+            response.raise_for_status()
+            data = response.json()
+            if 'jobs' in data:
+                return [job['slug'] for job in data['jobs']]
+        except requests.exceptions.RequestException as e:
+            print(f"Error fetching categories from Remotive API: {e}")
+        except ValueError as e:
+            print(f"Error decoding JSON response for categories: {e}")
+        return []
+
+    def fetch_category(self, category=None):
+        """
+        Yields JobRecords for one API request.
+
+        Args:
+            category: Category slug, or None for all categories.
+        """
+        params = {}
+        if category:
+            params['category'] = category
+        if self.search:
+            params['search'] = self.search
+        if self.limit:
+            params['limit'] = self.limit
+
+        print(f"Starting to fetch jobs from Remotive API with parameters: {params}")
+        try:
+            response = requests.get(self.api_url, params=params)
+            response.raise_for_status()  # Raise an exception for HTTP errors
+            data = response.json()
+        except requests.exceptions.RequestException as e:
+            print(f"Error during request to Remotive API: {e}")
+            return
+        except ValueError as e:
+            print(f"Error decoding JSON response from Remotive API: {e}")
+            return
+
+        if 'jobs' not in data:
+            print("No 'jobs' key found in the API response.")
+            return
+
+        yield from self.parse_jobs(data['jobs'])
+
+    def parse_jobs(self, jobs):
+        """
+        Maps Remotive API job objects to JobRecords.
+
+        Args:
+            jobs: List of job dicts as returned in the API's 'jobs' key.
+        """
+        ingestion_timestamp = datetime.now().isoformat()
+        for job in jobs:
+            yield JobRecord(
+                id=job.get("id"),
+                job_title=job.get("title"),
+                company_name=job.get("company_name"),
+                publication_date=normalize_date(job.get("publication_date")),
+                job_type=job.get("job_type"),
+                category=job.get("category"),
+                candidate_required_location=job.get("candidate_required_location"),
+                salary_range=job.get("salary") or None,
+                job_description=job.get("description"),
+                source_url=job.get("url"),
+                company_logo=job.get("company_logo"),
+                job_board=self.job_board,
+                ingestion_timestamp=ingestion_timestamp,
+            )
+
+    def fetch(self):
+        """Yields JobRecords for every configured category."""
+        if not self.categories:
+            yield from self.fetch_category()
+            return
+
+        for i, category in enumerate(self.categories):
+            if i and self.delay:
+                time.sleep(self.delay)  # Pause between category requests to be polite
+            yield from self.fetch_category(category)
+
+
+class FixtureSource(JobSource):
+    """
+    Adapter serving job records from local data, for tests and offline runs.
+
+    Attributes:
+        jobs (list): Dicts keyed by JobRecord field names.
+        job_board (str): Board name used for jobs that don't set `job_board`.
+    """
+
+    def __init__(self, jobs, name="fixture", job_board="Fixture"):
+        """
+        Initialize the FixtureSource.
+
+        Args:
+            jobs: List of dicts keyed by JobRecord field names, or the path of
+                a JSON file containing such a list.
+            name: Name of the source in the registry.
+            job_board: Board name used for jobs that don't set `job_board`.
+                `remote_jobs.job_board` is NOT NULL, so it must not be empty.
+        """
+        if isinstance(jobs, (str, Path)):
+            with open(jobs, encoding="utf-8") as f:
+                jobs = json.load(f)
+        self.jobs = jobs
+        self.name = name
+        self.job_board = job_board
+
+    def fetch(self):
+        """Yields the fixture jobs as JobRecords."""
+        for job in self.jobs:
+            yield JobRecord(**{"job_board": self.job_board, **job})
+
+
+class SourceRegistry:
+    """
+    Registry of job board adapters.
+
+    Attributes:
+        sources (dict): Registered adapters by name.
+    """
+
+    def __init__(self):
+        """Initialize an empty SourceRegistry."""
+        self.sources = {}
+
+    def register(self, source):
+        """
+        Registers a job board adapter.
+
+        Args:
+            source: JobSource instance. Its `name` must be unique.
+        """
+        if not source.name:
+            raise ValueError(f"{type(source).__name__} has no name.")
+        if source.name in self.sources:
+            raise ValueError(f"A source named '{source.name}' is already registered.")
+        self.sources[source.name] = source
+        return source
+
+    def run(self, names=None, queue_size=1000):
+        """
+        Runs adapters concurrently and yields their JobRecords as they arrive.
+
+        Each adapter runs in its own thread. Records pass through a bounded
+        queue, so a slow consumer pauses the adapters instead of buffering
+        everything in memory. An adapter that fails is logged and skipped.
+        If the consumer stops early (breaks out of the loop or closes the
+        generator), the adapters are stopped and their threads joined.
+
+        Args:
+            names: Names of the adapters to run. Defaults to all registered.
+            queue_size: Maximum records buffered between adapters and consumer.
+        """
+        sources = [self.sources[name] for name in (names or self.sources)]
+        if not sources:
+            return
+
+        records = queue.Queue(maxsize=queue_size)
+        done = object()
+        stop = threading.Event()
+
+        def put(item):
+            """Queues an item. Returns False if the consumer stopped while waiting."""
+            while not stop.is_set():
+                try:
+                    records.put(item, timeout=QUEUE_POLL_SECONDS)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce(source):
+            count = 0
+            try:
+                for record in source.fetch():
+                    if not put(record):
+                        break
+                    count += 1
+            except Exception as e:
+                logger.error(f"Source '{source.name}' failed: {e}")
+            finally:
+                logger.info(f"Source '{source.name}' produced {count} records.")
+                put(done)
+
+        threads = [
+            threading.Thread(target=produce, args=(source,), name=f"source-{source.name}", daemon=True)
+            for source in sources
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            remaining = len(threads)
+            while remaining:
+                record = records.get()
+                if record is done:
+                    remaining -= 1
+                else:
+                    yield record
+        finally:
+            # Unblocks adapters waiting on a full queue when the consumer stops early
+            stop.set()
+            for thread in threads:
+                thread.join()
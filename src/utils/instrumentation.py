@@ -0,0 +1,382 @@
+"""
+Pipeline Instrumentation - Remote Work Tracker
+===============================================
+Stage timers, row counters and resource metrics for the scrape, ETL and
+export scripts. Each run writes one structured JSON report so nightly jobs
+can track where time and memory go.
+
+Usage:
+    from instrumentation import stage, timed, reporting_run
+
+    @timed("transform")
+    def transform_data(df): ...
+
+    with reporting_run():  # Writes the report even if the run fails
+        with stage("load") as metrics:
+            load_data(df, db)
+            metrics.add_rows(len(df))
+
+Optional profiling is toggled with the PIPELINE_PROFILE environment variable,
+a comma-separated list of:
+    cprofile     dump a .prof file per top-level stage
+    tracemalloc  record the peak Python heap while each stage was active.
+                 tracemalloc counts the whole process, so when stages overlap
+                 in several threads each one reports the process peak during
+                 its own window, not an allocation share per thread.
+
+Each stage also records `rss_high_water_mb`: the process's lifetime peak RSS
+at the moment the stage finished. It is a high-water mark, not a per-stage peak.
+
+Reports are written to PIPELINE_REPORT_DIR (default: run_reports).
+"""
+
+import cProfile
+import functools
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from utils import get_current_timestamp
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV_VAR = "PIPELINE_PROFILE"
+REPORT_DIR_ENV_VAR = "PIPELINE_REPORT_DIR"
+
+
+def get_peak_rss_mb():
+    """Returns the peak resident set size of the process in MB, or None if unknown."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    if sys.platform == "darwin":
+        return round(peak / (1024 * 1024), 2)
+    return round(peak / 1024, 2)
+
+
+class StageMetrics:
+    """
+    Aggregated metrics for one named stage.
+
+    A stage entered several times (e.g. one scrape per category) accumulates
+    its calls, seconds and rows. Stages may run concurrently in several
+    threads, so updates go through the owning report's lock.
+    """
+
+    __slots__ = ("name", "calls", "seconds", "rows", "rss_high_water_mb",
+                 "tracemalloc_peak_mb", "profile_file")
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.seconds = 0.0
+        self.rows = 0
+        self.rss_high_water_mb = None
+        self.tracemalloc_peak_mb = None
+        self.profile_file = None
+
+    def add_rows(self, count):
+        """Adds to the number of rows processed by this stage."""
+        self.rows += int(count)
+
+    def to_dict(self):
+        """Returns the metrics as a JSON-serializable dict."""
+        return {
+            "calls": self.calls,
+            "seconds": round(self.seconds, 4),
+            "rows": self.rows,
+            "rows_per_second": round(self.rows / self.seconds, 2) if self.seconds else None,
+            "rss_high_water_mb": self.rss_high_water_mb,
+            "tracemalloc_peak_mb": self.tracemalloc_peak_mb,
+            "profile_file": self.profile_file,
+        }
+
+
+class _StageFrame:
+    """One active stage, with the process heap peak seen since it started."""
+
+    __slots__ = ("metrics", "peak")
+
+    def __init__(self, metrics):
+        self.metrics = metrics
+        self.peak = 0
+
+
+class RunReport:
+    """
+    Collects stage metrics for a single pipeline execution.
+
+    Attributes:
+        run_name (str): Name of the script or pipeline being run.
+        run_id (str): Unique identifier of this execution.
+        report_dir (Path): Directory the JSON report is written to.
+        profile (set): Enabled profilers ("cprofile", "tracemalloc").
+    """
+
+    def __init__(self, run_name, report_dir=None, profile=None):
+        """
+        Initialize the RunReport.
+
+        Args:
+            run_name: Name of the script or pipeline being run.
+            report_dir: Output directory. Defaults to $PIPELINE_REPORT_DIR or run_reports.
+            profile: Iterable of profilers to enable. Defaults to $PIPELINE_PROFILE.
+        """
+        self.run_name = run_name
+        self.run_id = f"{time.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        self.report_dir = Path(report_dir or os.environ.get(REPORT_DIR_ENV_VAR, "run_reports"))
+        if profile is None:
+            profile = os.environ.get(PROFILE_ENV_VAR, "").split(",")
+        self.profile = {p.strip().lower() for p in profile if p.strip()}
+        self.started_at = get_current_timestamp()
+        self._start = time.perf_counter()
+        self.stages = {}
+        self.error = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._profiling = False
+        # Active stages of every thread, which share tracemalloc's peak counter
+        self._frames = set()
+
+        if "tracemalloc" in self.profile and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Context manager timing a block of work as stage `name`.
+
+        Yields:
+            StageMetrics for the stage, so callers can record row counts.
+        """
+        with self._lock:
+            metrics = self.stages.get(name)
+            if metrics is None:
+                metrics = self.stages[name] = StageMetrics(name)
+
+            # Only one profiler can be active per process, so concurrent
+            # top-level stages in other threads are not profiled
+            top_level = not self._active_stack()
+            profiler = None
+            if top_level and "cprofile" in self.profile and not self._profiling:
+                profiler = cProfile.Profile()
+                self._profiling = True
+
+            frame = _StageFrame(metrics)
+            # tracemalloc has a single peak counter for the whole process, so
+            # before a stage resets it, every active stage in every thread
+            # keeps the peak it has seen so far
+            if tracemalloc.is_tracing():
+                self._collect_heap_peak()
+                tracemalloc.reset_peak()
+            self._frames.add(frame)
+        active = self._active_stack()
+        active.append(frame)
+        start = time.perf_counter()
+        if profiler:
+            profiler.enable()
+        try:
+            yield metrics
+        finally:
+            if profiler:
+                profiler.disable()
+            elapsed = time.perf_counter() - start
+            active.pop()
+
+            with self._lock:
+                stage_peak = None
+                if tracemalloc.is_tracing():
+                    self._collect_heap_peak()
+                    stage_peak = frame.peak
+                self._frames.discard(frame)
+
+                metrics.seconds += elapsed
+                metrics.calls += 1
+                metrics.rss_high_water_mb = get_peak_rss_mb()
+                if stage_peak is not None:
+                    peak = round(stage_peak / (1024 * 1024), 2)
+                    metrics.tracemalloc_peak_mb = max(metrics.tracemalloc_peak_mb or 0, peak)
+                if profiler:
+                    self.report_dir.mkdir(parents=True, exist_ok=True)
+                    profile_path = self.report_dir / f"{self.run_id}_{name}.prof"
+                    profiler.dump_stats(profile_path)
+                    metrics.profile_file = str(profile_path)
+                    self._profiling = False
+
+            logger.info(f"Stage '{name}' finished in {elapsed:.3f}s")
+
+    def _collect_heap_peak(self):
+        """Raises every active stage's heap peak to tracemalloc's current peak. Call with the lock held."""
+        peak = tracemalloc.get_traced_memory()[1]
+        for frame in self._frames:
+            frame.peak = max(frame.peak, peak)
+
+    def record(self, name, seconds, rows=0):
+        """
+        Adds a call measured elsewhere (e.g. in a worker process) to stage `name`.
+
+        Args:
+            name: Stage name.
+            seconds: Duration of the call.
+            rows: Number of rows processed.
+        """
+        with self._lock:
+            metrics = self.stages.get(name)
+            if metrics is None:
+                metrics = self.stages[name] = StageMetrics(name)
+            metrics.calls += 1
+            metrics.seconds += seconds
+            metrics.add_rows(rows)
+
+    def _active_stack(self):
+        """Returns the calling thread's stack of active stages."""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def count_rows(self, count):
+        """Adds rows to the calling thread's innermost active stage. Ignored outside a stage."""
+        active = self._active_stack()
+        if active:
+            with self._lock:
+                active[-1].metrics.add_rows(count)
+
+    def to_dict(self):
+        """Returns the full report as a JSON-serializable dict."""
+        return {
+            "run_id": self.run_id,
+            "run_name": self.run_name,
+            "started_at": self.started_at,
+            "finished_at": get_current_timestamp(),
+            "total_seconds": round(time.perf_counter() - self._start, 4),
+            "status": "failed" if self.error else "succeeded",
+            "error": self.error,
+            "peak_rss_mb": get_peak_rss_mb(),
+            "profile": sorted(self.profile),
+            "stages": {name: m.to_dict() for name, m in self.stages.items()},
+        }
+
+    def write(self, filename=None):
+        """
+        Writes the run report as JSON.
+
+        Args:
+            filename: Custom filename. Defaults to <run_name>_<run_id>.json.
+
+        Returns:
+            Path to the written report.
+        """
+        self.report_dir.mkdir(parents=True, exist_ok=True)
+        output_path = self.report_dir / (filename or f"{self.run_name}_{self.run_id}.json")
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        logger.info(f"Run report written to {output_path}")
+        return output_path
+
+
+_current_report = None
+_current_report_lock = threading.Lock()
+
+
+def get_run_report(run_name=None):
+    """Returns the active RunReport, starting one named after the script if needed."""
+    global _current_report
+    with _current_report_lock:
+        if _current_report is None:
+            _current_report = RunReport(run_name or Path(sys.argv[0]).stem or "pipeline")
+        return _current_report
+
+
+def stage(name):
+    """Context manager timing a block as stage `name` in the active run report."""
+    return get_run_report().stage(name)
+
+
+def count_rows(count):
+    """Adds rows to the innermost active stage of the active run report."""
+    get_run_report().count_rows(count)
+
+
+def record_stage(name, seconds, rows=0):
+    """Adds an externally measured call to stage `name` of the active run report."""
+    get_run_report().record(name, seconds, rows)
+
+
+def timed(name=None):
+    """
+    Decorator recording each call of a function as a stage.
+
+    If the function returns a sized object (e.g. a DataFrame), its length is
+    counted as the stage's rows.
+
+    Args:
+        name: Stage name. Defaults to the function name.
+    """
+    def decorator(func):
+        stage_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(stage_name):
+                result = func(*args, **kwargs)
+                if hasattr(result, "__len__") and not isinstance(result, (str, bytes, dict)):
+                    count_rows(len(result))
+                return result
+
+        return wrapper
+
+    return decorator
+
+
+def write_run_report(filename=None):
+    """Writes the active run report and clears it. Returns the report path."""
+    global _current_report
+    report = get_run_report()
+    output_path = report.write(filename)
+    _current_report = None
+    return output_path
+
+
+@contextmanager
+def reporting_run(run_name=None):
+    """
+    Context manager wrapping a script's run so its report is always written.
+
+    If the block raises, the error is recorded in the report before it is
+    written and the exception propagates.
+
+    Args:
+        run_name: Name of the run. Defaults to the script name.
+    """
+    report = get_run_report(run_name)
+    try:
+        yield report
+    except BaseException as e:
+        report.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        print(f"Run report: {write_run_report()}")
+
+
+# Example usage (for testing purposes)
+if __name__ == "__main__":
+    @timed("build_list")
+    def build_list(n):
+        return list(range(n))
+
+    with reporting_run():
+        with stage("example") as metrics:
+            metrics.add_rows(len(build_list(100000)))
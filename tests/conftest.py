@@ -0,0 +1,8 @@
+import sys
+from pathlib import Path
+
+# The scripts use flat imports (e.g. `from db_connector import DBConnector`),
+# so put each source directory on the path like the scripts expect.
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+for module_dir in ("db", "etl", "pipeline", "scraper", "utils"):
+    sys.path.insert(0, str(SRC_DIR / module_dir))
@@ -0,0 +1,106 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+import export_data
+import metadata_cache
+from db_connector import DBConnector
+from export_data import DataExporter
+from metadata_cache import load_metadata, metadata_path
+from sources import FixtureSource
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+@pytest.fixture
+def db_name(tmp_path):
+    db_name = str(tmp_path / "jobs.db")
+    db = DBConnector(db_name)
+    db.connect()
+    db.create_table()
+    db.insert_records(FixtureSource(FIXTURES / "remotive_jobs.json").fetch())
+    db.refresh_metadata()
+    db.disconnect()
+    return db_name
+
+
+def test_metadata_rebuilt_after_unrefreshed_insert(db_name):
+    assert "Data Analysis" not in load_metadata(db_name)["categories"]
+
+    # Load another board without refreshing the cache
+    db = DBConnector(db_name)
+    db.connect()
+    db.insert_records(FixtureSource(FIXTURES / "other_board_jobs.json").fetch())
+    db.disconnect()
+
+    metadata = load_metadata(db_name)
+    assert metadata["row_count"] == 4
+    assert "Data Analysis" in metadata["categories"]
+
+
+def test_metadata_answers_when_cache_cannot_be_written(db_name, monkeypatch):
+    def fail(*args, **kwargs):
+        raise PermissionError("read-only directory")
+
+    metadata_path(db_name).unlink()
+    monkeypatch.setattr(metadata_cache.os, "replace", fail)
+
+    assert load_metadata(db_name)["row_count"] == 2
+    assert not metadata_path(db_name).exists()
+    assert not list(Path(db_name).parent.glob("*.tmp"))
+
+
+def test_category_export_does_not_touch_the_cache(db_name, tmp_path):
+    metadata_path(db_name).unlink()
+
+    exporter = DataExporter(db_name=db_name, output_dir=str(tmp_path / "exports"))
+    output_path = exporter.export_by_category("Design", "design.csv")
+    assert len(output_path.read_text(encoding="utf-8").splitlines()) == 2
+    assert not metadata_path(db_name).exists()
+
+
+def test_refresh_metadata_does_not_create_missing_database(tmp_path, monkeypatch, capsys):
+    db_name = tmp_path / "missing.db"
+    monkeypatch.setattr(sys, "argv", ["export_data.py", "--refresh-metadata", "--db", str(db_name)])
+
+    export_data.main()
+
+    assert not db_name.exists()
+    assert "No metadata available" in capsys.readouterr().out
+
+
+def test_sharded_manifest_paths_are_relative(db_name, tmp_path):
+    exporter = DataExporter(db_name=db_name, output_dir=str(tmp_path / "exports"))
+    manifest_path = exporter.export_sharded(dirname="sharded", max_workers=1)
+
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    assert manifest["total_rows"] == 2
+    for entry in manifest["shards"]:
+        assert not Path(entry["path"]).is_absolute()
+        assert (manifest_path.parent / entry["path"]).stat().st_size == entry["bytes"]
+
+
+def test_sharded_export_refuses_non_empty_directory(db_name, tmp_path):
+    exporter = DataExporter(db_name=db_name, output_dir=str(tmp_path / "exports"))
+    assert exporter.export_sharded(dirname="sharded", max_workers=1) is not None
+    assert exporter.export_sharded(dirname="sharded", max_workers=1) is None
+
+
+@pytest.mark.parametrize("partition_by, index", [
+    (("category", "month"), "idx_remote_jobs_category_month"),
+    (("category",), "idx_remote_jobs_category_month"),
+    (("month",), "idx_remote_jobs_month"),
+])
+def test_shard_query_uses_index(db_name, partition_by, index):
+    db = DBConnector(db_name)
+    db.connect(read_only=True)
+    where = " AND ".join(f"{export_data.SHARD_KEYS[key]} IS ?" for key in partition_by)
+    values = {"category": "Design", "month": "2025-01"}
+    plan = db.conn.execute(
+        f"EXPLAIN QUERY PLAN SELECT * FROM remote_jobs WHERE {where} ORDER BY id;",
+        [values[key] for key in partition_by],
+    ).fetchall()
+    db.disconnect()
+    assert f"USING INDEX {index}" in plan[0][-1]
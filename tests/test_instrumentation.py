@@ -0,0 +1,68 @@
+import json
+import threading
+import tracemalloc
+
+import pytest
+
+import instrumentation
+from instrumentation import RunReport, reporting_run, stage
+
+
+def test_nested_stage_reports_its_own_heap_peak(tmp_path):
+    report = RunReport("test", report_dir=tmp_path, profile=["tracemalloc"])
+    try:
+        with report.stage("outer"):
+            big = bytearray(8 * 1024 * 1024)
+            del big
+            with report.stage("inner"):
+                small = bytearray(1024 * 1024)
+                del small
+    finally:
+        tracemalloc.stop()
+
+    inner = report.stages["inner"].tracemalloc_peak_mb
+    outer = report.stages["outer"].tracemalloc_peak_mb
+    assert 1 <= inner < 4
+    assert outer >= 8
+
+
+
+def test_stage_in_another_thread_keeps_heap_peak(tmp_path):
+    report = RunReport("test", report_dir=tmp_path, profile=["tracemalloc"])
+    allocated = threading.Event()
+    other_started = threading.Event()
+
+    def other_thread():
+        allocated.wait()
+        # Entering a stage resets tracemalloc's process-wide peak
+        with report.stage("other"):
+            other_started.set()
+
+    thread = threading.Thread(target=other_thread)
+    thread.start()
+    try:
+        with report.stage("big"):
+            big = bytearray(8 * 1024 * 1024)
+            del big
+            allocated.set()
+            other_started.wait()
+        thread.join()
+    finally:
+        tracemalloc.stop()
+
+    assert report.stages["big"].tracemalloc_peak_mb >= 8
+    assert report.stages["other"].tracemalloc_peak_mb < 4
+
+def test_failed_run_still_writes_report(tmp_path, monkeypatch):
+    monkeypatch.setattr(instrumentation, "_current_report", RunReport("test", report_dir=tmp_path))
+
+    with pytest.raises(RuntimeError):
+        with reporting_run():
+            with stage("load"):
+                raise RuntimeError("database is locked")
+
+    [report_file] = tmp_path.glob("test_*.json")
+    report = json.loads(report_file.read_text())
+    assert report["status"] == "failed"
+    assert report["error"] == "RuntimeError: database is locked"
+    assert report["stages"]["load"]["calls"] == 1
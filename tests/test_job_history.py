@@ -0,0 +1,76 @@
+import pytest
+
+from db_connector import DBConnector
+from job_history import JobHistory
+
+
+@pytest.fixture
+def history(tmp_path):
+    db = DBConnector(":memory:")
+    db.connect()
+    yield JobHistory(db, tmp_path / "snapshots")
+    db.disconnect()
+
+
+def test_open_close_and_reopen(history):
+    assert history.record_snapshot([1, 2, 3], "2025-01-01") == {
+        "opened": 3, "reopened": 0, "seen": 3, "closed": 0,
+    }
+    # Job 1 disappears, job 4 is new
+    assert history.record_snapshot([2, 3, 4], "2025-01-03") == {
+        "opened": 1, "reopened": 0, "seen": 3, "closed": 1,
+    }
+    # Job 1 comes back, jobs 2 and 3 disappear
+    assert history.record_snapshot([1, 4], "2025-01-05") == {
+        "opened": 0, "reopened": 1, "seen": 2, "closed": 2,
+    }
+
+    assert history.open_jobs_over_time("2024-12-31", "2025-01-06") == [
+        ("2024-12-31", 0),
+        ("2025-01-01", 3),
+        ("2025-01-02", 3),
+        ("2025-01-03", 3),  # 1 closed, 4 opened
+        ("2025-01-04", 3),
+        ("2025-01-05", 2),  # 1 reopened, 2 and 3 closed
+        ("2025-01-06", 2),
+    ]
+    assert history.count_open_jobs("2025-01-04") == 3
+
+    # The first closure of job 1 is kept alongside the closures of 2 and 3
+    assert sorted(history.time_to_fill()) == [(1, 2.0), (2, 4.0), (3, 4.0)]
+
+
+def test_snapshots_are_append_only(history):
+    history.record_snapshot([1, 2], "2025-01-01")
+    history.record_snapshot([2], "2025-01-01")
+
+    partition = history.snapshot_dir / "snapshot_date=2025-01-01"
+    contents = sorted(path.read_text() for path in partition.iterdir())
+    assert contents == ["1\n2\n", "2\n"]
+
+
+def test_job_closed_and_reopened_on_the_same_day(history):
+    history.record_snapshot([1, 2], "2025-01-01")
+    assert history.record_snapshot([2], "2025-01-01")["closed"] == 1
+    assert history.record_snapshot([1, 2], "2025-01-01") == {
+        "opened": 0, "reopened": 1, "seen": 2, "closed": 0,
+    }
+
+    assert history.count_open_jobs("2025-01-01") == 2
+    # No zero-length interval is left behind
+    assert history.time_to_fill() == []
+
+    # The next day, job 1 is simply still open
+    assert history.record_snapshot([1, 2], "2025-01-02") == {
+        "opened": 0, "reopened": 0, "seen": 2, "closed": 0,
+    }
+
+
+def test_failed_update_writes_no_snapshot(history, monkeypatch):
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(history, "write_snapshot", fail)
+    assert history.record_snapshot([1, 2], "2025-01-01") is None
+    assert history.count_open_jobs("2025-01-01") == 0
+    assert not history.snapshot_dir.exists()
@@ -0,0 +1,92 @@
+import pytest
+
+import instrumentation
+import pipeline
+from db_connector import DBConnector
+from job_record import JobRecord
+from pipeline import Pipeline
+
+
+def fake_source(jobs_per_category):
+    class FakeRemotiveSource:
+        def __init__(self, **kwargs):
+            pass
+
+        def fetch_category(self, category=None):
+            for job_id in jobs_per_category[category]:
+                yield JobRecord(
+                    id=job_id,
+                    job_title="Engineer",
+                    company_name="Acme",
+                    publication_date="2025-01-01T00:00:00",
+                    category=category,
+                    source_url=f"https://example.com/{job_id}",
+                    job_board="Remotive.com",
+                )
+    return FakeRemotiveSource
+
+
+def make_pipeline(tmp_path, **kwargs):
+    return Pipeline(db_name=str(tmp_path / "jobs.db"), workers=1, fetch_delay=0,
+                    export="none", snapshot_dir=str(tmp_path / "snapshots"), **kwargs)
+
+
+def count_lifecycle_rows(db_name):
+    db = DBConnector(db_name)
+    db.connect()
+    db.cursor.execute("SELECT name FROM sqlite_master WHERE name = 'job_lifecycle';")
+    if db.cursor.fetchone() is None:
+        count = 0
+    else:
+        db.cursor.execute("SELECT COUNT(*) FROM job_lifecycle;")
+        count = db.cursor.fetchone()[0]
+    db.disconnect()
+    return count
+
+
+def test_snapshot_skipped_when_a_category_is_empty(tmp_path, monkeypatch):
+    jobs = {"a": range(1, 51), "b": [], "c": range(51, 101)}
+    monkeypatch.setattr(pipeline, "get_remotive_categories", lambda: list(jobs))
+    monkeypatch.setattr(pipeline, "RemotiveSource", fake_source(jobs))
+
+    run = make_pipeline(tmp_path)
+    assert run.run() == 100
+    assert run.failed_categories == {"b"}
+    assert count_lifecycle_rows(run.db_name) == 0
+
+
+def test_snapshot_recorded_when_every_category_loads(tmp_path, monkeypatch):
+    jobs = {"a": range(1, 51), "c": range(51, 101)}
+    monkeypatch.setattr(pipeline, "get_remotive_categories", lambda: list(jobs))
+    monkeypatch.setattr(pipeline, "RemotiveSource", fake_source(jobs))
+
+    run = make_pipeline(tmp_path)
+    assert run.run() == 100
+    assert count_lifecycle_rows(run.db_name) == 100
+
+
+def test_failed_load_stage_does_not_hang(tmp_path, monkeypatch):
+    jobs = {slug: range(i * 10, i * 10 + 10) for i, slug in enumerate("abcdef")}
+    monkeypatch.setattr(pipeline, "RemotiveSource", fake_source(jobs))
+
+    # The database directory doesn't exist, so the load stage can't connect
+    run = Pipeline(db_name=str(tmp_path / "missing" / "jobs.db"), categories=list(jobs),
+                   workers=1, queue_size=1, fetch_delay=0, export="none")
+    with pytest.raises(RuntimeError, match="load stage failed"):
+        run.run()
+
+
+def test_transform_workers_write_no_profiles(tmp_path, monkeypatch):
+    jobs = {"a": range(1, 11), "c": range(11, 21)}
+    monkeypatch.setattr(pipeline, "RemotiveSource", fake_source(jobs))
+    monkeypatch.setenv("PIPELINE_PROFILE", "cprofile")
+    monkeypatch.setenv("PIPELINE_REPORT_DIR", str(tmp_path / "reports"))
+    monkeypatch.setattr(instrumentation, "_current_report", None)
+
+    make_pipeline(tmp_path, categories=list(jobs)).run()
+
+    report = instrumentation.get_run_report()
+    assert report.stages["transform"].calls == 2
+    profiles = list((tmp_path / "reports").glob("*.prof"))
+    assert profiles
+    assert all(path.name.startswith(report.run_id) for path in profiles)
@@ -0,0 +1,76 @@
+import threading
+from pathlib import Path
+
+import pytest
+
+from db_connector import DBConnector
+from sources import FixtureSource, JobSource, SourceRegistry
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+@pytest.fixture
+def db():
+    db = DBConnector(":memory:")
+    db.connect()
+    db.create_table()
+    yield db
+    db.disconnect()
+
+
+def test_job_source_requires_fetch():
+    class NoFetchSource(JobSource):
+        name = "no-fetch"
+
+    with pytest.raises(TypeError):
+        NoFetchSource()
+
+
+def test_registry_loads_fixture_sources(db):
+    registry = SourceRegistry()
+    registry.register(FixtureSource(FIXTURES / "remotive_jobs.json", name="remotive"))
+    registry.register(FixtureSource(FIXTURES / "other_board_jobs.json", name="other",
+                                    job_board="Example Jobs"))
+
+    assert db.insert_records(registry.run(), batch_size=1) == 4
+
+    db.cursor.execute("SELECT id, job_board, ingestion_timestamp FROM remote_jobs ORDER BY id;")
+    rows = db.cursor.fetchall()
+    assert [(job_id, board) for job_id, board, _ in rows] == [
+        (1001, "Remotive.com"),
+        (1002, "Remotive.com"),
+        (2001, "Example Jobs"),
+        (2002, "Example Jobs"),
+    ]
+    assert all(timestamp for _, _, timestamp in rows)
+
+    # A second load only finds duplicates
+    assert db.insert_records(FixtureSource(FIXTURES / "remotive_jobs.json").fetch()) == 0
+
+
+def test_insert_records_accepts_plain_tuples(db):
+    record = (1, "Engineer", "Acme", "2025-01-01T00:00:00", "full_time", "QA",
+              "Worldwide", None, None, "https://example.com/1", None, "Example Jobs")
+
+    assert db.insert_records([record]) == 1
+    db.cursor.execute("SELECT job_board, ingestion_timestamp FROM remote_jobs;")
+    job_board, ingestion_timestamp = db.cursor.fetchone()
+    assert job_board == "Example Jobs"
+    assert ingestion_timestamp is not None
+
+
+def test_closing_registry_stream_stops_sources():
+    jobs = [
+        {"id": job_id, "job_title": "Engineer", "company_name": "Acme",
+         "publication_date": "2025-01-01T00:00:00", "source_url": f"https://example.com/{job_id}"}
+        for job_id in range(100)
+    ]
+    registry = SourceRegistry()
+    registry.register(FixtureSource(jobs, name="first"))
+    registry.register(FixtureSource(jobs, name="second"))
+
+    stream = registry.run(queue_size=1)
+    next(stream)
+    stream.close()
+
+    assert not [thread for thread in threading.enumerate() if thread.name.startswith("source-")]